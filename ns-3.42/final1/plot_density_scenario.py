@@ -6,18 +6,74 @@ spécifique de MobilitySpeed, TrafficInterval et MaxRandomLoss.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import argparse
+from functools import lru_cache
+import hashlib
+import multiprocessing
 import os
 
+# matplotlib.pyplot est importé dans les fonctions de tracé seulement : --list et
+# le tableau récapitulatif n'ont pas à charger le backend graphique
+
+try:
+    from numba import njit
+except ImportError:  # numba est optionnel
+    njit = None
+
+ALGORITHMS = ['No-ADR', 'ADR-MAX', 'ADR-AVG', 'ADR-Lite']
+COLORS = {'No-ADR': '#2196F3', 'ADR-MAX': '#4CAF50', 'ADR-AVG': '#FF9800', 'ADR-Lite': '#E91E63'}
+MARKERS = {'No-ADR': 'o', 'ADR-MAX': 's', 'ADR-AVG': '^', 'ADR-Lite': 'D'}
+
+# Seules colonnes du CSV utilisées par le script
+COLUMNS = ['Algorithm', 'NumDevices', 'MobilitySpeed', 'TrafficInterval',
+           'MaxRandomLoss', 'PDR_Percent', 'AvgEnergy_mJ']
+
+FLOAT_COLUMNS = ['MobilitySpeed', 'MaxRandomLoss', 'PDR_Percent', 'AvgEnergy_mJ']
+
 def load_data(csv_path):
     """Charge les données du fichier CSV."""
-    df = pd.read_csv(csv_path)
+    read_kwargs = dict(usecols=COLUMNS, dtype={'Algorithm': 'category'})
+    try:
+        # Parseur multithread de pyarrow s'il est installé
+        df = pd.read_csv(csv_path, engine='pyarrow', **read_kwargs)
+    except (ImportError, ValueError):
+        # pyarrow absent, ou moteur / option non supporté par cette version de pandas
+        df = pd.read_csv(csv_path, **read_kwargs)
+    # Catégories ALGORITHMS d'abord, puis les éventuels autres algorithmes triés :
+    # comparaisons et groupby sur des codes entiers sans perdre de libellé
+    extra = sorted(set(df['Algorithm'].cat.categories.astype(str)) - set(ALGORITHMS))
+    df['Algorithm'] = df['Algorithm'].cat.set_categories(ALGORITHMS + extra)
+    # Précision réduite suffisante pour le tracé : moitié moins de mémoire parcourue.
+    # Les cellules vides ou non numériques deviennent NaN au lieu d'interrompre le chargement.
+    for col in FLOAT_COLUMNS:
+        df[col] = pd.to_numeric(df[col], errors='coerce', downcast='float')
+    # Intervalles entiers dans le CSV : affichés 72 et non 72.0 (--list, titres,
+    # noms de fichiers) ; float32 comme les autres paramètres sinon
+    interval = pd.to_numeric(df['TrafficInterval'], errors='coerce', downcast='integer')
+    if not pd.api.types.is_integer_dtype(interval):
+        interval = interval.astype('float32')
+    df['TrafficInterval'] = interval
+    num_devices = pd.to_numeric(df['NumDevices'], errors='coerce')
+    # Une ligne sans nombre de devices ne peut pas être placée sur l'axe des abscisses
+    if num_devices.isna().any():
+        df = df[num_devices.notna()].reset_index(drop=True)
+        num_devices = num_devices.dropna().reset_index(drop=True)
+    df['NumDevices'] = pd.to_numeric(num_devices, downcast='integer')
     return df
 
+def group_key(mobility_speed, traffic_interval, max_random_loss):
+    """
+    Clé (MobilitySpeed, TrafficInterval, MaxRandomLoss) au format des colonnes
+    float32 de load_data (33.3 != np.float32(33.3) en tant que clé de dict) ;
+    un intervalle entier a le même hash que son équivalent float32.
+    """
+    return (np.float32(mobility_speed), np.float32(traffic_interval), np.float32(max_random_loss))
+
 def filter_data(df, mobility_speed, traffic_interval, max_random_loss):
     """Filtre les données selon les paramètres spécifiés."""
+    mobility_speed, traffic_interval, max_random_loss = group_key(mobility_speed, traffic_interval,
+                                                                  max_random_loss)
     filtered = df[
         (df['MobilitySpeed'] == mobility_speed) &
         (df['TrafficInterval'] == traffic_interval) &
@@ -28,14 +84,95 @@ def filter_data(df, mobility_speed, traffic_interval, max_random_loss):
 def get_unique_values(df):
     """Affiche les valeurs uniques disponibles pour chaque paramètre."""
     print("\n=== Valeurs disponibles dans le fichier ===")
-    print(f"MobilitySpeed: {sorted(df['MobilitySpeed'].unique())}")
-    print(f"TrafficInterval: {sorted(df['TrafficInterval'].unique())}")
-    print(f"MaxRandomLoss: {sorted(df['MaxRandomLoss'].unique())}")
-    print(f"NumDevices: {sorted(df['NumDevices'].unique())}")
+    # np.unique trie directement en C (pas de tri Python sur des scalaires)
+    for column in ['MobilitySpeed', 'TrafficInterval', 'MaxRandomLoss', 'NumDevices']:
+        values = np.unique(df[column].to_numpy())
+        print(f"{column}: [{', '.join(map(str, values))}]")
     print(f"Algorithms: {df['Algorithm'].unique().tolist()}")
     print("=" * 45)
 
-def plot_comparison(df, mobility_speed, traffic_interval, max_random_loss, output_dir=None):
+def _figure_path(output_dir, prefix, mobility_speed, traffic_interval, max_random_loss):
+    """Chemin de l'image d'une combinaison de paramètres."""
+    filename = f"{prefix}_mob{mobility_speed}_traf{traffic_interval}_loss{max_random_loss}.png"
+    return os.path.join(output_dir, filename)
+
+def _save_figure(fig, output_dir, prefix, mobility_speed, traffic_interval, max_random_loss,
+                 dpi=150, bbox_inches='tight'):
+    """
+    Sauvegarde la figure dans output_dir et retourne le chemin du fichier.
+    dpi / bbox_inches à None reprennent les valeurs de plt.rcParams.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    filepath = _figure_path(output_dir, prefix, mobility_speed, traffic_interval, max_random_loss)
+    fig.savefig(filepath, dpi=dpi, bbox_inches=bbox_inches)
+    return filepath
+
+def create_comparison_lines(axes):
+    """
+    Crée une seule fois, dans les deux axes PDR / Énergie, une courbe vide par
+    algorithme ainsi que les éléments fixes (labels, grille).
+    Retourne une liste (une par axe) de dictionnaires {algorithme: Line2D}.
+    """
+    lines = []
+    for ax, ylabel in zip(axes, ['PDR (%)', 'Énergie Moyenne (mJ)']):
+        lines.append({
+            algo: ax.plot([], [], marker=MARKERS[algo], color=COLORS[algo],
+                          label=algo, linewidth=2, markersize=8, rasterized=True)[0]
+            for algo in ALGORITHMS
+        })
+        ax.set_xlabel('Nombre de Devices', fontsize=12)
+        ax.set_ylabel(ylabel, fontsize=12)
+        ax.grid(True, alpha=0.3)
+    return lines
+
+def plot_comparison_into(axes, lines, df, mobility_speed, traffic_interval, max_random_loss,
+                         ylim_bottom=None):
+    """
+    Met à jour les courbes PDR / Énergie créées par create_comparison_lines.
+    Seules les données des courbes existantes sont remplacées, ce qui permet de
+    réutiliser la même figure pour plusieurs combinaisons.
+    ylim_bottom fixe le bas de l'axe PDR (calculé depuis df si None).
+    """
+    # Tri unique puis partition par algorithme (accès O(1) dans les boucles) ;
+    # le tri est évité si l'appelant a déjà fourni des données triées
+    if df['NumDevices'].is_monotonic_increasing:
+        df_sorted = df
+    else:
+        df_sorted = df.sort_values('NumDevices', kind='stable', ignore_index=True)
+    algo_groups = dict(list(df_sorted.groupby('Algorithm', sort=False, observed=True)))
+    # Tableaux NumPy extraits une seule fois (matplotlib n'a plus à convertir des Series)
+    algo_arrays = {
+        algo: {column: algo_data[column].to_numpy()
+               for column in ['NumDevices', 'PDR_Percent', 'AvgEnergy_mJ']}
+        for algo, algo_data in algo_groups.items()
+    }
+    
+    title_suffix = f"(Mobilité={mobility_speed} km/h, Intervalle={traffic_interval}s, Perte={max_random_loss} dB)"
+    titles = [f'Taux de Livraison de Paquets (PDR)\n{title_suffix}',
+              f'Consommation Énergétique\n{title_suffix}']
+    
+    for ax, ax_lines, column, title in zip(axes, lines, ['PDR_Percent', 'AvgEnergy_mJ'], titles):
+        for algo, line in ax_lines.items():
+            arrays = algo_arrays.get(algo)
+            if arrays is not None:
+                line.set_data(arrays['NumDevices'], arrays[column])
+                line.set_visible(True)
+            else:
+                line.set_data([], [])
+                line.set_visible(False)
+        
+        ax.relim(visible_only=True)
+        ax.autoscale_view()
+        ax.set_title(title, fontsize=11)
+        ax.legend(handles=[line for line in ax_lines.values() if line.get_visible()],
+                  loc='best', fontsize=10)
+    
+    if ylim_bottom is None:
+        ylim_bottom = max(0, df['PDR_Percent'].min() - 5)
+    axes[0].set_ylim([ylim_bottom, 102])
+
+def plot_comparison(df, mobility_speed, traffic_interval, max_random_loss, output_dir=None,
+                    ylim_bottom=None):
     """
     Trace les graphiques de comparaison des algorithmes ADR.
     
@@ -45,81 +182,57 @@ def plot_comparison(df, mobility_speed, traffic_interval, max_random_loss, outpu
         traffic_interval: Intervalle de trafic (s)
         max_random_loss: Perte aléatoire maximale (dB)
         output_dir: Répertoire de sortie pour les images (optionnel)
-    """
+        ylim_bottom: Bas de l'axe PDR (optionnel, calculé depuis df sinon)
     
-    algorithms = ['No-ADR', 'ADR-MAX', 'ADR-AVG', 'ADR-Lite']
-    colors = {'No-ADR': '#2196F3', 'ADR-MAX': '#4CAF50', 'ADR-AVG': '#FF9800', 'ADR-Lite': '#E91E63'}
-    markers = {'No-ADR': 'o', 'ADR-MAX': 's', 'ADR-AVG': '^', 'ADR-Lite': 'D'}
+    Returns:
+        La figure créée (à fermer par l'appelant avec plt.close(fig))
+    """
+    import matplotlib.pyplot as plt
     
     # Créer la figure avec 2 sous-graphiques
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
-    
-    title_suffix = f"(Mobilité={mobility_speed} km/h, Intervalle={traffic_interval}s, Perte={max_random_loss} dB)"
-    
-    # --- Graphique 1: PDR vs NumDevices ---
-    ax1 = axes[0]
-    for algo in algorithms:
-        algo_data = df[df['Algorithm'] == algo].sort_values('NumDevices')
-        if not algo_data.empty:
-            ax1.plot(algo_data['NumDevices'], algo_data['PDR_Percent'], 
-                    marker=markers[algo], color=colors[algo], 
-                    label=algo, linewidth=2, markersize=8)
-    
-    ax1.set_xlabel('Nombre de Devices', fontsize=12)
-    ax1.set_ylabel('PDR (%)', fontsize=12)
-    ax1.set_title(f'Taux de Livraison de Paquets (PDR)\n{title_suffix}', fontsize=11)
-    ax1.legend(loc='best', fontsize=10)
-    ax1.grid(True, alpha=0.3)
-    ax1.set_ylim([max(0, df['PDR_Percent'].min() - 5), 102])
-    
-    # --- Graphique 2: Énergie vs NumDevices ---
-    ax2 = axes[1]
-    for algo in algorithms:
-        algo_data = df[df['Algorithm'] == algo].sort_values('NumDevices')
-        if not algo_data.empty:
-            ax2.plot(algo_data['NumDevices'], algo_data['AvgEnergy_mJ'], 
-                    marker=markers[algo], color=colors[algo], 
-                    label=algo, linewidth=2, markersize=8)
-    
-    ax2.set_xlabel('Nombre de Devices', fontsize=12)
-    ax2.set_ylabel('Énergie Moyenne (mJ)', fontsize=12)
-    ax2.set_title(f'Consommation Énergétique\n{title_suffix}', fontsize=11)
-    ax2.legend(loc='best', fontsize=10)
-    ax2.grid(True, alpha=0.3)
+    lines = create_comparison_lines(axes)
+    plot_comparison_into(axes, lines, df, mobility_speed, traffic_interval, max_random_loss,
+                         ylim_bottom)
     
     plt.tight_layout()
     
     # Sauvegarder si répertoire spécifié
     if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-        filename = f"density_mob{mobility_speed}_traf{traffic_interval}_loss{max_random_loss}.png"
-        filepath = os.path.join(output_dir, filename)
-        plt.savefig(filepath, dpi=150, bbox_inches='tight')
+        filepath = _save_figure(fig, output_dir, 'density', mobility_speed, traffic_interval, max_random_loss)
         print(f"Graphique sauvegardé: {filepath}")
     
     plt.show()
+    return fig
 
-def plot_bar_comparison(df, mobility_speed, traffic_interval, max_random_loss, output_dir=None):
+def plot_bar_comparison_into(axes, df, mobility_speed, traffic_interval, max_random_loss,
+                             ylim_bottom=None):
     """
-    Trace des graphiques en barres pour une meilleure visualisation.
+    Dessine les graphiques en barres dans deux axes existants (effacés au préalable).
     """
-    algorithms = ['No-ADR', 'ADR-MAX', 'ADR-AVG', 'ADR-Lite']
-    colors = {'No-ADR': '#2196F3', 'ADR-MAX': '#4CAF50', 'ADR-AVG': '#FF9800', 'ADR-Lite': '#E91E63'}
+    algorithms = ALGORITHMS
+    colors = COLORS
     
-    num_devices_list = sorted(df['NumDevices'].unique())
+    # Matrices (NumDevices x algorithme) des deux métriques, extraites une seule fois
+    means = (df.groupby(['NumDevices', 'Algorithm'], observed=True)[['PDR_Percent', 'AvgEnergy_mJ']]
+               .mean().unstack())
+    pdr_matrix = means['PDR_Percent'].reindex(columns=algorithms).to_numpy()
+    energy_matrix = means['AvgEnergy_mJ'].reindex(columns=algorithms).to_numpy()
+    present = ~np.isnan(pdr_matrix).all(axis=0)
+    
+    num_devices_list = means.index.tolist()
     x = np.arange(len(num_devices_list))
     width = 0.2
     
-    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
     title_suffix = f"(Mobilité={mobility_speed} km/h, Intervalle={traffic_interval}s, Perte={max_random_loss} dB)"
     
     # --- Graphique 1: PDR en barres ---
     ax1 = axes[0]
+    ax1.clear()
     for i, algo in enumerate(algorithms):
-        algo_data = df[df['Algorithm'] == algo].sort_values('NumDevices')
-        if not algo_data.empty:
-            pdr_values = algo_data['PDR_Percent'].values
-            ax1.bar(x + i*width, pdr_values, width, label=algo, color=colors[algo], alpha=0.85)
+        if present[i]:
+            ax1.bar(x + i*width, pdr_matrix[:, i], width, label=algo, color=colors[algo], alpha=0.85,
+                    rasterized=True)
     
     ax1.set_xlabel('Nombre de Devices', fontsize=12)
     ax1.set_ylabel('PDR (%)', fontsize=12)
@@ -128,15 +241,17 @@ def plot_bar_comparison(df, mobility_speed, traffic_interval, max_random_loss, o
     ax1.set_xticklabels(num_devices_list)
     ax1.legend(loc='best', fontsize=10)
     ax1.grid(True, alpha=0.3, axis='y')
-    ax1.set_ylim([max(0, df['PDR_Percent'].min() - 5), 102])
+    if ylim_bottom is None:
+        ylim_bottom = max(0, df['PDR_Percent'].min() - 5)
+    ax1.set_ylim([ylim_bottom, 102])
     
     # --- Graphique 2: Énergie en barres ---
     ax2 = axes[1]
+    ax2.clear()
     for i, algo in enumerate(algorithms):
-        algo_data = df[df['Algorithm'] == algo].sort_values('NumDevices')
-        if not algo_data.empty:
-            energy_values = algo_data['AvgEnergy_mJ'].values
-            ax2.bar(x + i*width, energy_values, width, label=algo, color=colors[algo], alpha=0.85)
+        if present[i]:
+            ax2.bar(x + i*width, energy_matrix[:, i], width, label=algo, color=colors[algo], alpha=0.85,
+                    rasterized=True)
     
     ax2.set_xlabel('Nombre de Devices', fontsize=12)
     ax2.set_ylabel('Énergie Moyenne (mJ)', fontsize=12)
@@ -145,24 +260,93 @@ def plot_bar_comparison(df, mobility_speed, traffic_interval, max_random_loss, o
     ax2.set_xticklabels(num_devices_list)
     ax2.legend(loc='best', fontsize=10)
     ax2.grid(True, alpha=0.3, axis='y')
+
+def plot_bar_comparison(df, mobility_speed, traffic_interval, max_random_loss, output_dir=None,
+                        ylim_bottom=None):
+    """
+    Trace des graphiques en barres pour une meilleure visualisation.
+    Retourne la figure créée.
+    """
+    import matplotlib.pyplot as plt
+    
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    plot_bar_comparison_into(axes, df, mobility_speed, traffic_interval, max_random_loss,
+                             ylim_bottom)
     
     plt.tight_layout()
     
     # Sauvegarder si répertoire spécifié
     if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-        filename = f"density_bar_mob{mobility_speed}_traf{traffic_interval}_loss{max_random_loss}.png"
-        filepath = os.path.join(output_dir, filename)
-        plt.savefig(filepath, dpi=150, bbox_inches='tight')
+        filepath = _save_figure(fig, output_dir, 'density_bar', mobility_speed, traffic_interval, max_random_loss)
         print(f"Graphique en barres sauvegardé: {filepath}")
     
     plt.show()
+    return fig
+
+# Taille à partir de laquelle le noyau numba compense son temps de compilation
+NUMBA_MIN_ROWS = 100_000
+
+def _group_mean_numpy(values, group_ids, ngroups):
+    """Moyenne par groupe via np.bincount, valeurs NaN ignorées (NaN pour les
+    groupes vides)."""
+    valid = ~np.isnan(values)
+    sums = np.bincount(group_ids[valid], weights=values[valid], minlength=ngroups)
+    counts = np.bincount(group_ids[valid], minlength=ngroups)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return sums / counts
+
+def _group_mean_kernel(values, group_ids, ngroups):
+    """Moyenne par groupe en une passe, valeurs NaN ignorées (compilé par numba)."""
+    sums = np.zeros(ngroups)
+    counts = np.zeros(ngroups, np.int64)
+    for i in range(len(values)):
+        if not np.isnan(values[i]):
+            sums[group_ids[i]] += values[i]
+            counts[group_ids[i]] += 1
+    means = np.full(ngroups, np.nan)
+    for g in range(ngroups):
+        if counts[g] > 0:
+            means[g] = sums[g] / counts[g]
+    return means
+
+if njit is not None:
+    _group_mean_kernel = njit(cache=True)(_group_mean_kernel)
+
+def group_means(df, columns):
+    """
+    Moyennes de `columns` par (NumDevices, Algorithm).
+    Retourne un dictionnaire {colonne: DataFrame NumDevices x algorithme}.
+    """
+    algo_codes = df['Algorithm'].cat.codes.to_numpy()
+    known = algo_codes >= 0
+    dev_codes, num_devices = pd.factorize(df['NumDevices'].to_numpy()[known], sort=True)
+    categories = df['Algorithm'].cat.categories
+    n_algos = len(categories)
+    ngroups = len(num_devices) * n_algos
+    group_ids = (dev_codes * n_algos + algo_codes[known]).astype(np.int64)
+    
+    use_numba = njit is not None and len(group_ids) >= NUMBA_MIN_ROWS
+    group_mean = _group_mean_kernel if use_numba else _group_mean_numpy
+    
+    index = pd.Index(num_devices, name='NumDevices')
+    algo_index = pd.Index(categories, name='Algorithm')
+    tables = {}
+    for column in columns:
+        values = df[column].to_numpy(dtype=np.float64)[known]
+        means = group_mean(values, group_ids, ngroups).reshape(len(num_devices), n_algos)
+        # Ne garder que les algorithmes présents (comme observed=True), colonnes
+        # triées par nom comme le faisait pivot_table
+        tables[column] = (pd.DataFrame(means, index=index, columns=algo_index)
+                          .dropna(axis=1, how='all').sort_index(axis=1))
+    return tables
 
 def print_summary_table(df):
     """Affiche un tableau récapitulatif des résultats."""
     print("\n=== Tableau Récapitulatif ===")
-    pivot_pdr = df.pivot_table(values='PDR_Percent', index='NumDevices', columns='Algorithm', aggfunc='mean')
-    pivot_energy = df.pivot_table(values='AvgEnergy_mJ', index='NumDevices', columns='Algorithm', aggfunc='mean')
+    # Une seule passe de regroupement pour les deux métriques
+    tables = group_means(df, ['PDR_Percent', 'AvgEnergy_mJ'])
+    pivot_pdr = tables['PDR_Percent']
+    pivot_energy = tables['AvgEnergy_mJ']
     
     print("\nPDR (%) par algorithme et nombre de devices:")
     print(pivot_pdr.round(2).to_string())
@@ -171,44 +355,164 @@ def print_summary_table(df):
     print(pivot_energy.round(4).to_string())
     print()
 
-def generate_all_plots(df, mobility_speeds, traffic_intervals, max_random_losses, output_dir, include_bar=False):
+# Réglages de rendu du mode --all : résolution réduite et pas de seconde passe
+# de rendu pour calculer la boîte englobante 'tight'
+BATCH_RC_PARAMS = {
+    'savefig.dpi': 100,
+    'savefig.bbox': 'standard',
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+# État des processus de rendu, initialisé par _init_worker
+_worker_groups = None
+_worker_output_dir = None
+_worker_include_bar = False
+_worker_ylim_bottom = None
+_worker_figures = {}
+
+def _init_worker(groups, output_dir, include_bar, ylim_bottom):
+    """Initialise un processus de rendu (backend Agg, données partagées)."""
+    global _worker_groups, _worker_output_dir, _worker_include_bar, _worker_ylim_bottom
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.rcParams.update(BATCH_RC_PARAMS)
+    _worker_groups = groups
+    _worker_output_dir = output_dir
+    _worker_include_bar = include_bar
+    _worker_ylim_bottom = ylim_bottom
+
+def _worker_figure(kind):
+    """
+    Retourne (fig, axes, lignes) pour le type de graphique demandé, créés une
+    seule fois par processus. `lignes` vaut None pour les graphiques en barres.
+    """
+    if kind not in _worker_figures:
+        import matplotlib.pyplot as plt
+        if kind == 'density':
+            fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+            _worker_figures[kind] = (fig, axes, create_comparison_lines(axes))
+        else:
+            fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+            _worker_figures[kind] = (fig, axes, None)
+    return _worker_figures[kind]
+
+def _render_one(combo):
+    """
+    Trace les graphiques d'une combinaison présente dans les données; retourne combo.
+    Les figures du processus sont réutilisées et ne sont donc jamais fermées ici.
+    """
+    mobility, interval, loss = combo
+    filtered_df = _worker_groups[group_key(*combo)]
+    
+    # Graphique en lignes (figure réutilisée d'une combinaison à l'autre)
+    fig, axes, lines = _worker_figure('density')
+    plot_comparison_into(axes, lines, filtered_df, mobility, interval, loss, _worker_ylim_bottom)
+    fig.tight_layout()
+    _save_figure(fig, _worker_output_dir, 'density', mobility, interval, loss,
+                 dpi=None, bbox_inches=None)
+    
+    # Graphique en barres si demandé
+    if _worker_include_bar:
+        fig, axes, _ = _worker_figure('density_bar')
+        plot_bar_comparison_into(axes, filtered_df, mobility, interval, loss, _worker_ylim_bottom)
+        fig.tight_layout()
+        _save_figure(fig, _worker_output_dir, 'density_bar', mobility, interval, loss,
+                     dpi=None, bbox_inches=None)
+    
+    return combo
+
+@lru_cache(maxsize=None)
+def _script_digest():
+    """
+    Empreinte du code de ce script : toute modification du rendu invalide le
+    cache de --all sans version à incrémenter à la main.
+    """
+    with open(__file__, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def _cache_marker(output_dir, csv_path, combo, include_bar):
+    """
+    Chemin du marqueur de cache d'une combinaison. La clé dépend des paramètres,
+    du chemin et de la date de modification du CSV et du code du script.
+    """
+    mobility, interval, loss = combo
+    key_source = (f"{mobility}_{interval}_{loss}_{include_bar}_{os.path.abspath(csv_path)}_"
+                  f"{os.path.getmtime(csv_path)}_{_script_digest()}")
+    key = hashlib.sha1(key_source.encode()).hexdigest()[:10]
+    return os.path.join(output_dir, '.cache', f"{key}.ok")
+
+def _is_cached(output_dir, csv_path, combo, include_bar):
+    """Vrai si les images de la combinaison sont à jour sur disque."""
+    prefixes = ['density', 'density_bar'] if include_bar else ['density']
+    return (os.path.exists(_cache_marker(output_dir, csv_path, combo, include_bar)) and
+            all(os.path.exists(_figure_path(output_dir, prefix, *combo)) for prefix in prefixes))
+
+def generate_all_plots(df, mobility_speeds, traffic_intervals, max_random_losses, output_dir,
+                       include_bar=False, processes=None, csv_path=None):
     """
     Génère tous les graphiques pour toutes les combinaisons de paramètres.
+    Les combinaisons sont indépendantes et rendues en parallèle (`processes`
+    processus, tous les cœurs par défaut).
+    Si csv_path est fourni, les combinaisons dont les images sont déjà à jour
+    (même paramètres, même CSV) ne sont pas régénérées.
     """
     import matplotlib
     matplotlib.use('Agg')  # Backend non-interactif pour sauvegarder sans afficher
     
-    total_combinations = len(mobility_speeds) * len(traffic_intervals) * len(max_random_losses)
+    # Combinaisons demandées, indexées par leur clé au format des colonnes
+    wanted = {group_key(mobility, interval, loss): (mobility, interval, loss)
+              for mobility in mobility_speeds
+              for interval in traffic_intervals
+              for loss in max_random_losses}
+    
+    # Un seul parcours groupby : seules les combinaisons présentes dans les
+    # données sont visitées, puis filtrées sur les valeurs demandées
+    # Tri global unique : chaque groupe (et chaque algorithme) est déjà trié
+    df = df.sort_values('NumDevices', kind='stable', ignore_index=True)
+    groups = {}
+    for key, sub_df in df.groupby(['MobilitySpeed', 'TrafficInterval', 'MaxRandomLoss'], sort=False):
+        if key in wanted:
+            groups[key] = sub_df
+    combos = [combo for key, combo in wanted.items() if key in groups]
+    
+    # Bas commun de l'axe PDR, calculé une seule fois
+    pdr_floor = max(0, df['PDR_Percent'].min() - 5)
     generated = 0
-    skipped = 0
-    
-    print(f"\n=== Génération de {total_combinations} combinaisons ===\n")
-    
-    for mobility in mobility_speeds:
-        for interval in traffic_intervals:
-            for loss in max_random_losses:
-                filtered_df = filter_data(df, mobility, interval, loss)
-                
-                if filtered_df.empty:
-                    print(f"[SKIP] Aucune donnée pour: mob={mobility}, interval={interval}, loss={loss}")
-                    skipped += 1
-                    continue
-                
-                print(f"[OK] Génération: mob={mobility}, interval={interval}, loss={loss}")
-                
-                # Graphique en lignes
-                plot_comparison(filtered_df, mobility, interval, loss, output_dir)
-                plt.close('all')
-                
-                # Graphique en barres si demandé
-                if include_bar:
-                    plot_bar_comparison(filtered_df, mobility, interval, loss, output_dir)
-                    plt.close('all')
-                
-                generated += 1
+    skipped = len(wanted) - len(combos)
+    cached = 0
+    
+    print(f"\n=== Génération de {len(wanted)} combinaisons ===\n")
+    
+    for key, (mobility, interval, loss) in wanted.items():
+        if key not in groups:
+            print(f"[SKIP] Aucune donnée pour: mob={mobility}, interval={interval}, loss={loss}")
+    
+    if csv_path is not None:
+        to_render = []
+        for combo in combos:
+            if _is_cached(output_dir, csv_path, combo, include_bar):
+                print(f"[CACHE] À jour: mob={combo[0]}, interval={combo[1]}, loss={combo[2]}")
+                cached += 1
+            else:
+                to_render.append(combo)
+        combos = to_render
+        os.makedirs(os.path.join(output_dir, '.cache'), exist_ok=True)
+    
+    with multiprocessing.Pool(processes, initializer=_init_worker,
+                              initargs=(groups, output_dir, include_bar, pdr_floor)) as pool:
+        for combo in pool.imap_unordered(_render_one, combos):
+            mobility, interval, loss = combo
+            print(f"[OK] Généré: mob={mobility}, interval={interval}, loss={loss}")
+            generated += 1
+            if csv_path is not None:
+                open(_cache_marker(output_dir, csv_path, combo, include_bar), 'w').close()
     
     print(f"\n=== Résumé ===")
     print(f"Graphiques générés: {generated}")
+    print(f"Graphiques déjà à jour (cache): {cached}")
     print(f"Combinaisons ignorées (pas de données): {skipped}")
     print(f"Répertoire de sortie: {output_dir}")
 
@@ -232,6 +536,10 @@ def main():
                         help='Ne pas afficher les graphiques (seulement sauvegarder)')
     parser.add_argument('--all', action='store_true',
                         help='Générer tous les graphiques pour toutes les combinaisons')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Nombre de processus pour --all (défaut: tous les cœurs)')
+    parser.add_argument('--force', action='store_true',
+                        help='Régénérer tous les graphiques de --all sans utiliser le cache')
     
     args = parser.parse_args()
     
@@ -254,7 +562,8 @@ def main():
         max_random_losses = [0.0, 3.96, 7.92]
         
         generate_all_plots(df, mobility_speeds, traffic_intervals, max_random_losses, 
-                          args.output, include_bar=args.bar)
+                          args.output, include_bar=args.bar, processes=args.jobs,
+                          csv_path=None if args.force else args.csv)
         return
     
     # Filtrer les données
@@ -281,9 +590,12 @@ def main():
         # Sauvegarder sans afficher
         import matplotlib
         matplotlib.use('Agg')
-        plot_comparison(filtered_df, args.mobility, args.interval, args.loss, args.output)
+        import matplotlib.pyplot as plt
+        fig = plot_comparison(filtered_df, args.mobility, args.interval, args.loss, args.output)
+        plt.close(fig)
         if args.bar:
-            plot_bar_comparison(filtered_df, args.mobility, args.interval, args.loss, args.output)
+            fig = plot_bar_comparison(filtered_df, args.mobility, args.interval, args.loss, args.output)
+            plt.close(fig)
 
 if __name__ == "__main__":
     main()
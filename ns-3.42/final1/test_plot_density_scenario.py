@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Tests du tableau récapitulatif de plot_density_scenario.py.
+Lancement depuis final1/ : python -m unittest test_plot_density_scenario
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import plot_density_scenario as pds
+
+CSV_WITH_EMPTY_CELL = """Algorithm,NumDevices,MobilitySpeed,TrafficInterval,MaxRandomLoss,PDR_Percent,AvgEnergy_mJ
+No-ADR,200,0,72,0,60.0,10.0
+ADR-AVG,200,0,72,0,71.4,9.0
+ADR-AVG,200,0,72,0,,9.5
+ADR-AVG,100,0,72,0,80.0,8.0
+"""
+
+class GroupMeansNaNTest(unittest.TestCase):
+    """Les cellules vides (NaN) sont ignorées comme avec pivot_table."""
+
+    def setUp(self):
+        fd, self.csv_path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w') as f:
+            f.write(CSV_WITH_EMPTY_CELL)
+
+    def tearDown(self):
+        os.remove(self.csv_path)
+
+    def test_summary_skips_empty_cell(self):
+        df = pds.load_data(self.csv_path)
+        tables = pds.group_means(df, ['PDR_Percent', 'AvgEnergy_mJ'])
+        self.assertAlmostEqual(tables['PDR_Percent'].loc[200, 'ADR-AVG'], 71.4, places=4)
+        self.assertAlmostEqual(tables['AvgEnergy_mJ'].loc[200, 'ADR-AVG'], 9.25, places=4)
+
+    def test_numpy_and_kernel_agree(self):
+        values = np.array([1.0, np.nan, 3.0, np.nan])
+        group_ids = np.array([0, 0, 1, 2], dtype=np.int64)
+        for group_mean in (pds._group_mean_numpy, pds._group_mean_kernel):
+            means = group_mean(values, group_ids, 3)
+            np.testing.assert_allclose(means[:2], [1.0, 3.0])
+            self.assertTrue(np.isnan(means[2]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,12 +6,34 @@ Auteur: Bonice
 Date: 2025
 """
 
+import argparse
+import hashlib
+import os
+import pickle
+import re
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # rendu fichier uniquement (aucun plt.show)
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import polars as pl
+except ImportError:  # polars est optionnel
+    pl = None
+
+try:
+    from numba import njit
+except ImportError:  # numba est optionnel
+    njit = None
+
 # Configuration du style
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
@@ -20,6 +42,10 @@ plt.rcParams['font.size'] = 10
 plt.rcParams['axes.titlesize'] = 12
 plt.rcParams['axes.labelsize'] = 11
 plt.rcParams['legend.fontsize'] = 9
+# Simplification des chemins pour accélérer le rendu Agg
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 
 # Couleurs pour chaque algorithme
 COLORS = {
@@ -36,25 +62,397 @@ MARKERS = {
     'No-ADR': 'D'
 }
 
+# Graduations d'axes communes, calculées une seule fois à l'import
+PERCENT_TICKS = np.arange(0, 101, 20)
+NUM_DEVICES_TICKS = np.arange(100, 1001, 100)
+# Intervalles de trafic (s) et équivalents en messages par heure
+TRAFFIC_SECONDS = (72, 300, 600, 900, 1200, 1800, 2400, 3600)
+TRAFFIC_MSGS_PER_HOUR = tuple(3600 // t for t in TRAFFIC_SECONDS)
+TRAFFIC_XTICK_LABELS = tuple(str(m) for m in TRAFFIC_MSGS_PER_HOUR)
+TRAFFIC_SCENARIO_SECONDS = (72, 360, 1800, 3600)
+TRAFFIC_SCENARIO_MSGS_PER_HOUR = tuple(3600 // t for t in TRAFFIC_SCENARIO_SECONDS)
+TRAFFIC_SCENARIO_XTICK_LABELS = tuple(f'{m} messages per hour' for m in TRAFFIC_SCENARIO_MSGS_PER_HOUR)
+
+# Résolution de tous les graphiques: 150 dpi suffisent et
+# divisent par 4 les pixels à encoder (PNG/zlib) par rapport à 300 dpi
+DPI = 150
+
+# Ordre de référence des algorithmes (catégories de la colonne `alg`)
+ALGORITHMS = ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']
+
+# Styles indexés par code de catégorie de `alg` (gris / 'o' en dernière
+# position pour les valeurs hors ALGORITHMS)
+COLOR_ARR = np.array([COLORS[a] for a in ALGORITHMS] + ['#7f7f7f'])
+MARKER_ARR = [MARKERS[a] for a in ALGORITHMS] + ['o']
+ALG_CODES = {a: i for i, a in enumerate(ALGORITHMS)}
+
+
+def alg_code(alg):
+    """Indice de style (COLOR_ARR / MARKER_ARR) d'un algorithme."""
+    return ALG_CODES.get(alg, len(ALGORITHMS))
+
+
+def style_codes(codes):
+    """Ramène les codes de catégorie hors ALGORITHMS sur le style par défaut."""
+    return np.minimum(codes, len(ALGORITHMS))
+
+
+# Détection de l'algorithme dans un nom de fichier ('-' ou '_', casse libre),
+# ramené au nom canonique de ALGORITHMS
+_ALG_RE = re.compile(r'(ADR[-_]AVG|ADR[-_]Lite|ADR[-_]MAX|No[-_]ADR)', re.IGNORECASE)
+_ALG_NORMALIZE = {a.upper(): a for a in ALGORITHMS}
+
+
+def to_alg_category(series):
+    """Convertit la colonne `alg` en catégorie: ALGORITHMS d'abord, puis les
+    éventuelles autres valeurs (ex. 'Unknown') triées."""
+    extra = sorted(set(series.dropna().astype(str)) - set(ALGORITHMS))
+    return series.astype(pd.CategoricalDtype(ALGORITHMS + extra))
+
+
+def cache_algs(df):
+    """Calcule une seule fois la liste des algorithmes présents dans `df`
+    (ordre des catégories) et la stocke dans `df.attrs['algs']`."""
+    # comptage sur les codes de catégorie, sans hacher les chaînes
+    counts = df['alg'].value_counts(sort=False)
+    df.attrs['algs'] = list(counts.index[counts.to_numpy() > 0])
+    return df.attrs['algs']
+
+
+def get_algs(df):
+    """Retourne la liste d'algorithmes mise en cache par `cache_algs`."""
+    if 'algs' not in df.attrs:
+        return cache_algs(df)
+    return df.attrs['algs']
+
+
+# Paramètres de simulation susceptibles de varier d'un scénario à l'autre
+PARAM_COLUMNS = ['MobilitySpeed', 'NumDevices', 'TrafficInterval', 'Sigma']
+
+
+def cache_variable_params(df):
+    """Détecte une seule fois les paramètres qui varient dans `df` et stocke
+    `{colonne: nombre de valeurs distinctes}` (ordre PARAM_COLUMNS) dans
+    `df.attrs['variable_params']`."""
+    counts = {}
+    for col in PARAM_COLUMNS:
+        if col in df.columns:
+            n = df[col].nunique()
+            if n > 1:
+                counts[col] = n
+    df.attrs['variable_params'] = counts
+    return counts
+
+
+def get_variable_params(df):
+    """Retourne les paramètres variables mis en cache par `cache_variable_params`."""
+    if 'variable_params' not in df.attrs:
+        return cache_variable_params(df)
+    return df.attrs['variable_params']
+
+
+def cache_attrs(df):
+    """Met à jour les métadonnées en cache (`algs`, `variable_params`)."""
+    cache_algs(df)
+    cache_variable_params(df)
+
+
+# Concaténations mémorisées par identité du dictionnaire de scénarios
+_COMBINED = {}
+# Seules colonnes utilisées par les graphiques à paramètres fixes: les autres
+# ne sont ni copiées par la concaténation ni converties
+COMBINED_COLUMNS = ['alg'] + PARAM_COLUMNS + ['PDR_Percent', 'AvgEnergy_mJ']
+
+
+def combine_scenarios(dfs_dict):
+    """Concatène une seule fois tous les scénarios de `dfs_dict`.
+
+    Le DataFrame obtenu (colonnes COMBINED_COLUMNS, paramètres numériques,
+    colonne `MessagesPerHour`, `alg` catégorielle, attrs recalculés) est
+    mémorisé et partagé par les graphiques à paramètres fixes. Un DataFrame
+    déjà combiné est retourné tel quel, ce qui permet de le construire dans
+    `main` et de le passer directement aux workers.
+    Retourne None si aucun scénario n'est disponible.
+    """
+    if isinstance(dfs_dict, pd.DataFrame):
+        return dfs_dict
+    cached = _COMBINED.get(id(dfs_dict))
+    if cached is not None and cached[0] is dfs_dict:
+        return cached[1]
+    if not dfs_dict:
+        return None
+
+    # pd.concat plutôt que pyarrow.concat_tables: les scénarios n'ont pas tous
+    # les mêmes types (MobilitySpeed entier ou flottant) et l'aller-retour
+    # pandas -> Arrow -> pandas est ~10x plus lent sur ces quelques centaines de lignes
+    all_df = pd.concat([df[[c for c in COMBINED_COLUMNS if c in df.columns]] for df in dfs_dict.values()],
+                       ignore_index=True)
+    # Normaliser les colonnes numériques en un seul appel
+    cols = [c for c in PARAM_COLUMNS if c in all_df.columns]
+    all_df[cols] = all_df[cols].apply(pd.to_numeric, errors='coerce')
+    # Messages par heure calculés une seule fois pour toutes les lignes
+    # (NaN si l'intervalle est nul ou absent)
+    if 'TrafficInterval' in all_df.columns:
+        interval = all_df['TrafficInterval'].to_numpy(dtype=float)
+        all_df['MessagesPerHour'] = np.divide(3600.0, interval, out=np.full_like(interval, np.nan),
+                                              where=interval != 0)
+    # les catégories peuvent différer entre scénarios: recalculer
+    all_df['alg'] = to_alg_category(all_df['alg'])
+    cache_attrs(all_df)
+    _COMBINED[id(dfs_dict)] = (dfs_dict, all_df)
+    return all_df
+
+
+# Taille à partir de laquelle le groupby multithread de polars compense la
+# conversion pandas -> Arrow (en dessous, groupby pandas)
+POLARS_MIN_ROWS = 100_000
+
+
+def _mean_by_alg_polars(df, param, columns):
+    """Moyennes par (alg, param) calculées par polars, même format que mean_by_alg."""
+    keys = ['alg', param]
+    means = (pl.from_pandas(df[keys + columns].astype({'alg': str}))
+             .drop_nulls(keys)
+             .group_by(keys)
+             .agg(pl.col(columns).mean())
+             .sort(keys)
+             .to_pandas())
+    return means.set_index(keys).unstack('alg')
+
+
+def mean_by_alg(df, param, columns=('PDR_Percent', 'AvgEnergy_mJ')):
+    """Moyennes de `columns` par (alg, param) en un seul groupby.
+
+    Retourne un DataFrame indexé par les valeurs de `param` (déjà triées par
+    le groupby, aucun sort_values n'est nécessaire ensuite), avec des
+    colonnes (métrique, alg); `means[metric][alg].dropna()` donne la courbe
+    d'un algorithme. Les gros DataFrames passent par polars s'il est installé.
+    """
+    columns = list(columns)
+    if pl is not None and len(df) >= POLARS_MIN_ROWS:
+        return _mean_by_alg_polars(df, param, columns)
+    return df.groupby(['alg', param], observed=True, sort=True)[columns].mean().unstack('alg')
+
+
+def curves_by_alg(table, algs=ALGORITHMS):
+    """Extrait d'une table (index = x, colonnes = alg) les courbes non vides
+    {alg: (x, y)} dans l'ordre de `algs`, sans les valeurs manquantes."""
+    curves = {}
+    for alg in algs:
+        if alg not in table.columns:
+            continue
+        col = table[alg].dropna()
+        if not col.empty:
+            curves[alg] = (col.index.to_numpy(), col.to_numpy())
+    return curves
+
+
+def plot_alg_lines(ax, curves, linewidth=2, markersize=None):
+    """Trace les courbes {alg: (x, y)} avec une seule LineCollection plus un
+    scatter de marqueurs par algorithme, au lieu d'un `ax.plot` par courbe.
+
+    Retourne les poignées de légende (une par algorithme) à passer à
+    `ax.legend(handles=...)`.
+    """
+    if not curves:
+        return []
+    if markersize is None:
+        markersize = plt.rcParams['lines.markersize']
+    codes = [alg_code(a) for a in curves]
+    segments = [np.column_stack(xy) for xy in curves.values()]
+    ax.add_collection(LineCollection(segments, colors=COLOR_ARR[codes],
+                                     linewidths=linewidth, capstyle='round', joinstyle='round'))
+    handles = []
+    for code, (alg, (x, y)) in zip(codes, curves.items()):
+        ax.scatter(x, y, marker=MARKER_ARR[code], color=COLOR_ARR[code],
+                   s=markersize ** 2, zorder=2.5)
+        handles.append(Line2D([], [], marker=MARKER_ARR[code], color=COLOR_ARR[code],
+                              linewidth=linewidth, markersize=markersize, label=alg))
+    ax.autoscale_view()
+    return handles
+
+
+# Colonnes de mesures réduites au chargement. Sigma et MobilitySpeed restent
+# en float64: elles sont comparées par égalité à des littéraux (3.96, 33.33)
+# que float32 ne représente pas exactement.
+FLOAT_METRICS = ['PDR_Percent', 'AvgEnergy_mJ']
+INT_COLUMNS = ['NumDevices', 'TrafficInterval', 'TotalPackets', 'SuccessfulPackets']
+
+
+def downcast_numeric(df):
+    """Réduit en place les colonnes numériques (float32 pour les mesures,
+    plus petit entier possible pour les compteurs)."""
+    for col in FLOAT_METRICS:
+        if col in df.columns and pd.api.types.is_float_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='float')
+    for col in INT_COLUMNS:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
+
+def box_stats(values, label):
+    """Statistiques d'une boîte pour `Axes.bxp`, calculées avec NumPy.
+
+    Mêmes conventions que `Axes.boxplot` (quartiles, moustaches à 1.5 IQR
+    ramenées sur la donnée la plus proche, valeurs hors moustaches en fliers).
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return {'label': label, 'med': np.nan, 'q1': np.nan, 'q3': np.nan,
+                'whislo': np.nan, 'whishi': np.nan, 'fliers': values}
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    low = values[values >= q1 - 1.5 * iqr]
+    high = values[values <= q3 + 1.5 * iqr]
+    whislo = low.min() if low.size else q1
+    whishi = high.max() if high.size else q3
+    return {'label': label, 'med': med, 'q1': q1, 'q3': q3,
+            'whislo': whislo, 'whishi': whishi,
+            'fliers': values[(values < whislo) | (values > whishi)]}
+
+
+# Figures réutilisées d'un graphique à l'autre, par taille (voir reuse_figure)
+_FIGURES = {}
+
+
+def reuse_figure(figsize):
+    """Retourne une figure vidée de taille `figsize`, réutilisée entre les appels.
+
+    La figure n'est jamais fermée: son tampon Agg et les caches de polices sont
+    conservés d'un graphique à l'autre. Les appelants ne doivent donc pas
+    appeler `plt.close()` dessus; `plt.figure(reuse_figure(...))` la rend
+    courante pour l'API pyplot.
+    """
+    fig = _FIGURES.get(figsize)
+    if fig is None or not plt.fignum_exists(fig.number):
+        # Mise en page contrainte, résolue au moment du savefig: aucun appel
+        # à tight_layout n'est nécessaire dans les fonctions de tracé
+        fig = plt.figure(figsize=figsize, layout='constrained')
+        _FIGURES[figsize] = fig
+    else:
+        fig.clear()
+    return fig
+
+
+def save_figure(fig, out_path, dpi=DPI, digest=None, svg=False):
+    """Sauvegarde `fig` en PNG dans `out_path`, plus une copie vectorielle .svg
+    à côté si `svg` est vrai (option --svg de main; son coût ne dépend pas du
+    dpi). Avec `digest` (voir figure_digest), l'empreinte est enregistrée pour
+    que figure_is_current puisse éviter le prochain rendu."""
+    fig.savefig(out_path, dpi=dpi)
+    if svg:
+        fig.savefig(Path(out_path).with_suffix('.svg'))
+    if digest is not None:
+        hash_path = _figure_hash_path(out_path)
+        try:
+            hash_path.parent.mkdir(exist_ok=True)
+            hash_path.write_text(digest)
+        except OSError:
+            pass
+
+
+@lru_cache(maxsize=None)
+def _script_digest():
+    """Empreinte du code de ce script: toute modification (styles, libellés,
+    mise en page) invalide les figures déjà produites."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def figure_digest(*parts, svg=False):
+    """Empreinte d'une figure à partir de ses données tracées et de ses
+    réglages (`parts`, sérialisables par pickle), du code, de la résolution
+    et de la copie .svg."""
+    payload = pickle.dumps((_script_digest(), DPI, svg, parts), protocol=4)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _figure_hash_path(out_path):
+    out_path = Path(out_path)
+    return out_path.parent / '.png_hash' / f'{out_path.name}.sha'
+
+
+def figure_is_current(out_path, digest, svg=False):
+    """Vrai si `out_path` (et sa copie .svg si `svg`) existe déjà et a été
+    produit avec la même empreinte: le rendu et l'encodage PNG peuvent alors
+    être sautés."""
+    out_path = Path(out_path)
+    if not out_path.exists() or (svg and not out_path.with_suffix('.svg').exists()):
+        return False
+    try:
+        return _figure_hash_path(out_path).read_text() == digest
+    except OSError:
+        return False
+
+
+def reuse_axes(figsize):
+    """Retourne `(fig, ax)` pour un graphique à un seul Axes de taille `figsize`.
+
+    Si la figure réutilisée contient déjà un seul Axes, il est simplement vidé
+    avec `ax.clear()` (ses ticks et son renderer sont conservés) au lieu de
+    recréer Figure et Axes; sinon la figure est vidée et un Axes est créé.
+    Les limites et ticks sont remis par défaut: à redéfinir à chaque tracé.
+    """
+    fig = _FIGURES.get(figsize)
+    if fig is not None and plt.fignum_exists(fig.number) and len(fig.axes) == 1:
+        ax = fig.axes[0]
+        ax.clear()
+        return fig, ax
+    fig = reuse_figure(figsize)
+    return fig, fig.subplots()
+
+
+# Colonnes lues dans les CSV de résumé (après normalisation des noms)
+NEEDED_COLUMNS = {'alg', 'Algorithm', 'algorithm', 'Algorithme', 'algorithme',
+                  *FLOAT_METRICS, *PARAM_COLUMNS, 'SuccessfulPackets'}
+
+
+def _normalize_column(name):
+    """Nom de colonne normalisé (trim, underscore pour espaces)."""
+    if isinstance(name, str):
+        return name.strip().replace(' ', '_')
+    return name
+
+
+def _read_csv(file_path, **read_kwargs):
+    """pd.read_csv avec le parseur multithread de pyarrow s'il est installé.
+
+    Repli sur le parseur C sans pyarrow, avec pandas < 1.4 (moteur inconnu:
+    ValueError) ou si pyarrow refuse le fichier (ArrowInvalid est une ValueError).
+    """
+    try:
+        return pd.read_csv(file_path, engine='pyarrow', **read_kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(file_path, **read_kwargs)
+
+
 def load_data(file_path):
     """Charge les données depuis un fichier CSV et normalise les colonnes.
 
+    - Ne lit que les colonnes utiles (NEEDED_COLUMNS), mesures en float32.
     - Nettoie les noms de colonnes (trim, underscore pour espaces).
     - Crée la colonne `alg` si elle n'existe pas (recherche variantes comme
       "Algorithm", "algorithm" ou extraction depuis le nom de fichier).
+    - Convertit `alg` en catégorie et met en cache la liste des algorithmes
+      (`df.attrs['algs']`) et des paramètres variables (`df.attrs['variable_params']`).
+    - Convertit les paramètres (MobilitySpeed, NumDevices, ...) en numérique.
+    - Réduit les mesures en float32 et les compteurs en petits entiers.
     Retourne un DataFrame prêt à être utilisé par les fonctions de plot.
     """
-    df = pd.read_csv(file_path)
+    # Ne lire que les colonnes utilisées par les graphiques (en-tête lu seul
+    # d'abord, les noms bruts pouvant contenir des espaces)
+    header = pd.read_csv(file_path, nrows=0).columns
+    usecols = [c for c in header if _normalize_column(c) in NEEDED_COLUMNS] or None
+    dtype = {c: 'float32' for c in (usecols or []) if _normalize_column(c) in FLOAT_METRICS}
+    try:
+        df = _read_csv(file_path, usecols=usecols, dtype=dtype)
+    except ValueError:
+        # mesure non numérique dans le fichier: lecture sans dtype imposé
+        df = _read_csv(file_path, usecols=usecols)
 
     # Normaliser les noms de colonnes (retirer espaces, trim)
-    new_cols = []
-    for c in df.columns:
-        if isinstance(c, str):
-            nc = c.strip().replace(' ', '_')
-        else:
-            nc = c
-        new_cols.append(nc)
-    df.columns = new_cols
+    df.columns = [_normalize_column(c) for c in df.columns]
 
     # Assurer que nous avons une colonne 'alg' (format attendu par le reste du script)
     if 'alg' not in df.columns:
@@ -66,30 +464,104 @@ def load_data(file_path):
 
     # Si toujours absent, essayer d'extraire l'algorithme depuis le nom de fichier
     if 'alg' not in df.columns:
-        fname = Path(file_path).name
-        found = None
-        known_algs = ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR', 'ADR_AVG', 'ADR_MAX', 'No_ADR']
-        for ka in known_algs:
-            if ka in fname:
-                found = ka
-                break
-        if found is None:
-            # essai plus permissif : chercher tokens ADR ou NO-ADR
-            lower = fname.lower()
-            if 'adr-lite' in lower:
-                found = 'ADR-Lite'
-            elif 'adr-avg' in lower or 'adr_avg' in lower:
-                found = 'ADR-AVG'
-            elif 'adr-max' in lower or 'adr_max' in lower:
-                found = 'ADR-MAX'
-            elif 'no-adr' in lower or 'no_adr' in lower:
-                found = 'No-ADR'
-
-        df['alg'] = found if found is not None else 'Unknown'
+        m = _ALG_RE.search(Path(file_path).name)
+        df['alg'] = _ALG_NORMALIZE[m.group(1).upper().replace('_', '-')] if m else 'Unknown'
+
+    # Catégorie: comparaisons `df['alg'] == alg` sur des codes entiers
+    df['alg'] = to_alg_category(df['alg'])
+    # Paramètres convertis une seule fois (valeurs non numériques -> NaN), les
+    # filtres en aval sont alors de simples comparaisons numériques
+    cols = [c for c in PARAM_COLUMNS if c in df.columns]
+    df[cols] = df[cols].apply(pd.to_numeric, errors='coerce')
+    downcast_numeric(df)
+    cache_attrs(df)
 
     return df
 
 
+@lru_cache(maxsize=None)
+def load_data_cached(file_path):
+    """Comme `load_data`, mais avec un cache Feather (Arrow IPC) à côté du CSV.
+
+    Le fichier `<nom>.arrow` est réutilisé tant qu'il est plus récent que le
+    CSV et que ce script; sinon le CSV est relu puis reconverti. Le format
+    Arrow se relit sans décodage (types, catégorie `alg` comprise, conservés
+    tels quels), environ deux fois plus vite que Parquet sur ces fichiers.
+    Les appels répétés sur un même chemin (absolu) dans le processus sont
+    mémorisés. Sans pyarrow (ou dossier en lecture seule), on lit le CSV.
+    """
+    csv_path = Path(file_path)
+    arrow_path = csv_path.with_suffix('.arrow')
+    try:
+        newest_source = max(csv_path.stat().st_mtime, Path(__file__).stat().st_mtime)
+        if arrow_path.exists() and arrow_path.stat().st_mtime >= newest_source:
+            df = pd.read_feather(arrow_path)
+            cache_attrs(df)
+            return df
+    except (ImportError, OSError, ValueError):
+        pass
+
+    df = load_data(file_path)
+    try:
+        df.to_feather(arrow_path, compression='lz4')
+    except (ImportError, OSError, ValueError):
+        pass
+    return df
+
+
+def scenario_cache_path(scenario, paths, cache_dir):
+    """Chemin du cache Feather d'un scénario complet (CSV concaténés).
+
+    Le nom contient une empreinte des chemins des CSV, de leurs dates de
+    modification et tailles, et de la date de ce script: toute modification
+    d'une source donne un nouveau fichier, sans test de fraîcheur à la lecture.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    for path in sorted(str(Path(p).resolve()) for p in paths):
+        st = os.stat(path)
+        h.update(f'{path}|{st.st_mtime_ns}|{st.st_size}\n'.encode())
+    h.update(str(Path(__file__).stat().st_mtime_ns).encode())
+    return Path(cache_dir) / f'{scenario}_{h.hexdigest()}.arrow'
+
+
+def read_scenario_cache(cache_path):
+    """Relit le DataFrame d'un scénario depuis son cache, ou None (absent,
+    illisible ou pyarrow non installé)."""
+    try:
+        if not cache_path.exists():
+            return None
+        df = pd.read_feather(cache_path)
+    except (ImportError, OSError, ValueError):
+        return None
+    cache_attrs(df)
+    return df
+
+
+def write_scenario_cache(df, cache_path):
+    """Écrit le cache d'un scénario et supprime ses anciennes versions
+    (empreintes périmées). Les erreurs d'écriture sont ignorées."""
+    scenario = cache_path.name.rsplit('_', 1)[0]
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        for old in cache_path.parent.glob(f'{scenario}_*.arrow'):
+            if old != cache_path and old.name.rsplit('_', 1)[0] == scenario:
+                old.unlink()
+        df.to_feather(cache_path, compression='lz4')
+    except (ImportError, OSError, ValueError):
+        pass
+
+
+@lru_cache(maxsize=None)
+def _csv_index(base):
+    """Liste des CSV sous `base` (ordre de parcours de rglob), construite une
+    seule fois par processus et partagée par les fonctions de recherche."""
+    base = Path(base)
+    if not base.exists():
+        return ()
+    return tuple(base.rglob('*.csv'))
+
+
+@lru_cache(maxsize=None)
 def find_summary_path(scenario, filename):
     """Cherche le fichier de résumé :
     - d'abord tel quel dans le répertoire courant
@@ -108,22 +580,25 @@ def find_summary_path(scenario, filename):
         if alt.exists():
             return str(alt)
 
+        index = _csv_index(base)
+
         # glob alternatives in scenario folder
         scen_dir = base / scenario
-        if scen_dir.exists():
-            candidates = list(scen_dir.glob(f'summary*{scenario}*run*.csv')) + list(scen_dir.glob('summary_*_run*.csv'))
-            if candidates:
-                return str(candidates[0])
+        in_scen_dir = [f for f in index if f.parent == scen_dir]
+        candidates = ([f for f in in_scen_dir if fnmatchcase(f.name, f'summary*{scenario}*run*.csv')]
+                      + [f for f in in_scen_dir if fnmatchcase(f.name, 'summary_*_run*.csv')])
+        if candidates:
+            return str(candidates[0])
 
         # last resort: search anywhere under this base for a file containing scenario
-        if base.exists():
-            for f in base.rglob(f'*{scenario}*.csv'):
+        for f in index:
+            if fnmatchcase(f.name, f'*{scenario}*.csv'):
                 return str(f)
 
     return None
 
 
-def plot_pdr_energy_by_scenario(df, scenario_name, output_dir='output'):
+def plot_pdr_energy_by_scenario(df, scenario_name, output_dir='output', svg=False):
     """
     Crée 4 graphiques par scénario:
     1. packet delivery rate en fonction du paramètre variable
@@ -131,8 +606,6 @@ def plot_pdr_energy_by_scenario(df, scenario_name, output_dir='output'):
     3. packet delivery rate vs Énergie (scatter plot)
     4. Boxplot comparatif packet delivery rate et Énergie
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
     # Déterminer le paramètre variable selon le scénario
     param_map = {
         'mobilite': 'MobilitySpeed',
@@ -141,64 +614,72 @@ def plot_pdr_energy_by_scenario(df, scenario_name, output_dir='output'):
         'sigma': 'Sigma'
     }
     
-    param = param_map.get(scenario_name, 'MobilitySpeed')
-    
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    # Scénario inconnu, ou paramètre attendu constant dans les données: repli
+    # sur le paramètre qui prend le plus de valeurs distinctes (détecté au chargement)
+    variable_params = get_variable_params(df)
+    param = param_map.get(scenario_name)
+    if param is None or param not in variable_params:
+        param = max(variable_params, key=variable_params.get) if variable_params else 'MobilitySpeed'
+    algs = get_algs(df)
+    means = mean_by_alg(df, param)
+    
+    fig = reuse_figure((16, 12))
+    axes = fig.subplots(2, 2)
     fig.suptitle(f'Analyse des performances - Scénario: {scenario_name.upper()}', 
                  fontsize=16, fontweight='bold')
     
     # 1. packet delivery rate en fonction du paramètre
     ax1 = axes[0, 0]
-    for alg in df['alg'].unique():
-        alg_data = df[df['alg'] == alg].groupby(param)['PDR_Percent'].mean().reset_index()
-        ax1.plot(alg_data[param], alg_data['PDR_Percent'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2, markersize=8)
+    ax1_handles = plot_alg_lines(ax1, curves_by_alg(means['PDR_Percent'], algs), linewidth=2, markersize=8)
     
     ax1.set_xlabel(f'{param}', fontweight='bold')
     ax1.set_ylabel('packet delivery rate (%)', fontweight='bold')
     ax1.set_title('Taux de livraison de paquets (packet delivery rate)', fontweight='bold')
     # For packet delivery rate ensure 0-100 with steps of 20
     ax1.set_ylim(0, 100)
-    ax1.set_yticks(np.arange(0, 101, 20))
+    ax1.set_yticks(PERCENT_TICKS)
     # If x param is density or traffic interval clamp ticks/range as requested
     if param == 'NumDevices':
         ax1.set_xlim(100, 1000)
-        ax1.set_xticks(np.arange(100, 1001, 100))
+        ax1.set_xticks(NUM_DEVICES_TICKS)
     if param == 'TrafficInterval':
         ax1.set_xlim(72, 3600)
         # friendly ticks for traffic interval
-        ax1.set_xticks([72, 300, 600, 900, 1200, 1800, 2400, 3600])
-    ax1.legend(loc='best')
+        ax1.set_xticks(TRAFFIC_SECONDS)
+    ax1.legend(handles=ax1_handles, loc='best')
     ax1.grid(True, alpha=0.3)
     
     # 2. Énergie en fonction du paramètre
     ax2 = axes[0, 1]
-    for alg in df['alg'].unique():
-        alg_data = df[df['alg'] == alg].groupby(param)['AvgEnergy_mJ'].mean().reset_index()
-        ax2.plot(alg_data[param], alg_data['AvgEnergy_mJ'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2, markersize=8)
+    ax2_handles = plot_alg_lines(ax2, curves_by_alg(means['AvgEnergy_mJ'], algs), linewidth=2, markersize=8)
     
     ax2.set_xlabel(f'{param}', fontweight='bold')
     ax2.set_ylabel('Énergie moyenne (mJ)', fontweight='bold')
     ax2.set_title('Consommation énergétique', fontweight='bold')
-    ax2.legend(loc='best')
+    ax2.legend(handles=ax2_handles, loc='best')
     ax2.grid(True, alpha=0.3)
     
     # 3. packet delivery rate vs Énergie (scatter plot)
     ax3 = axes[1, 0]
-    for alg in df['alg'].unique():
-        alg_data = df[df['alg'] == alg]
-        ax3.scatter(alg_data['AvgEnergy_mJ'], alg_data['PDR_Percent'], 
-                   marker=MARKERS[alg], color=COLORS[alg], 
-                   label=alg, s=100, alpha=0.6, edgecolors='black')
+    # Un seul scatter par style de marqueur (scatter n'accepte qu'un marqueur),
+    # les couleurs étant passées point par point
+    codes = style_codes(df['alg'].cat.codes.to_numpy())
+    energy = df['AvgEnergy_mJ'].to_numpy()
+    pdr = df['PDR_Percent'].to_numpy()
+    algs_by_marker = {}
+    for alg in algs:
+        algs_by_marker.setdefault(MARKER_ARR[alg_code(alg)], []).append(alg)
+    for marker, marker_algs in algs_by_marker.items():
+        mask = np.isin(codes, [alg_code(a) for a in marker_algs])
+        ax3.scatter(energy[mask], pdr[mask], 
+                   marker=marker, c=COLOR_ARR[codes[mask]], 
+                   label=', '.join(marker_algs), s=100, alpha=0.6, edgecolors='black')
     
     ax3.set_xlabel('Énergie moyenne (mJ)', fontweight='bold')
     ax3.set_ylabel('packet delivery rate (%)', fontweight='bold')
     ax3.set_title('Compromis packet delivery rate vs Énergie', fontweight='bold')
     ax3.set_ylim(0, 100)
-    ax3.set_yticks(np.arange(0, 101, 20))
+    ax3.set_yticks(PERCENT_TICKS)
     ax3.legend(loc='best')
     ax3.grid(True, alpha=0.3)
     
@@ -206,27 +687,31 @@ def plot_pdr_energy_by_scenario(df, scenario_name, output_dir='output'):
     ax4 = axes[1, 1]
     
     # Normaliser les données pour la comparaison (échelle 0-100)
-    df_normalized = df.copy()
     # guard against division by zero
     max_energy = df['AvgEnergy_mJ'].max() if df['AvgEnergy_mJ'].max() and not np.isnan(df['AvgEnergy_mJ'].max()) else 1.0
-    df_normalized['Energy_Normalized'] = (df['AvgEnergy_mJ'] / max_energy) * 100
+    energy_norm = (df['AvgEnergy_mJ'].to_numpy() / max_energy) * 100
     
-    # Préparer les données pour le boxplot
+    # Préparer les données pour le boxplot: positions des lignes de chaque
+    # algorithme calculées une seule fois, puis extraction par indices
+    groups = df.groupby('alg', observed=True).indices
+    pdr_vals = df['PDR_Percent'].to_numpy()
     data_to_plot = []
     labels_to_plot = []
     
-    for alg in df['alg'].unique():
-        data_to_plot.append(df[df['alg'] == alg]['PDR_Percent'].values)
+    for alg in algs:
+        idx = groups[alg]
+        data_to_plot.append(pdr_vals[idx])
         labels_to_plot.append(f'{alg}\n(packet delivery rate)')
-        data_to_plot.append(df_normalized[df_normalized['alg'] == alg]['Energy_Normalized'].values)
+        data_to_plot.append(energy_norm[idx])
         labels_to_plot.append(f'{alg}\n(Énergie)')
     
-    bp = ax4.boxplot(data_to_plot, labels=labels_to_plot, patch_artist=True)
+    bp = ax4.bxp([box_stats(v, label) for v, label in zip(data_to_plot, labels_to_plot)],
+                 patch_artist=True)
     
     # Colorer les boxplots
     colors_list = []
-    for alg in df['alg'].unique():
-        colors_list.extend([COLORS[alg], COLORS[alg]])
+    for alg in algs:
+        colors_list.extend([COLOR_ARR[alg_code(alg)]] * 2)
     
     for patch, color in zip(bp['boxes'], colors_list):
         patch.set_facecolor(color)
@@ -235,55 +720,62 @@ def plot_pdr_energy_by_scenario(df, scenario_name, output_dir='output'):
     ax4.set_ylabel('Valeur (%)', fontweight='bold')
     # keep y-axis for comparisons within 0-100
     ax4.set_ylim(0, 100)
-    ax4.set_yticks(np.arange(0, 101, 20))
+    ax4.set_yticks(PERCENT_TICKS)
     ax4.set_title('Distribution comparée (packet delivery rate et Énergie normalisée)', fontweight='bold')
     ax4.grid(True, alpha=0.3, axis='y')
     plt.setp(ax4.xaxis.get_majorticklabels(), rotation=45, ha='right')
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/analyse_complete_{scenario_name}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f'{output_dir}/analyse_complete_{scenario_name}.png', svg=svg)
     print(f"✓ Graphique sauvegardé: analyse_complete_{scenario_name}.png")
 
 
-def plot_parameter_comparison(dfs_dict, output_dir='output'):
+def plot_parameter_comparison(dfs_dict, output_dir='output', svg=False):
     """
     Compare l'effet de différents paramètres sur les performances
     dfs_dict: dictionnaire {scenario_name: dataframe}
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = reuse_figure((16, 12))
+    axes = fig.subplots(2, 2)
     fig.suptitle('Comparaison des paramètres sur packet delivery rate et Énergie', 
                  fontsize=16, fontweight='bold')
     
     scenarios = list(dfs_dict.keys())
     
-    # Pour chaque algorithme
-    for idx, alg in enumerate(['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']):
+    # Moyennes par algorithme pour chaque scénario, un seul groupby par scénario
+    scenario_means = {
+        scenario_name: df.groupby('alg', observed=True)[['PDR_Percent', 'AvgEnergy_mJ']].mean()
+        for scenario_name, df in dfs_dict.items()
+    }
+    
+    # Pour chaque algorithme (l'indice est aussi son code de style)
+    for idx, alg in enumerate(ALGORITHMS):
         ax = axes[idx // 2, idx % 2]
+        color = COLOR_ARR[idx]
         
         # Calculer les moyennes pour chaque scénario
         pdr_means = []
         energy_means = []
         scenario_labels = []
         
-        for scenario_name, df in dfs_dict.items():
-            alg_data = df[df['alg'] == alg]
-            pdr_means.append(alg_data['PDR_Percent'].mean())
-            energy_means.append(alg_data['AvgEnergy_mJ'].mean())
+        for scenario_name, means in scenario_means.items():
+            if alg in means.index:
+                pdr_means.append(means.at[alg, 'PDR_Percent'])
+                energy_means.append(means.at[alg, 'AvgEnergy_mJ'])
+            else:
+                pdr_means.append(np.nan)
+                energy_means.append(np.nan)
             scenario_labels.append(scenario_name.replace('_', ' ').title())
         
         x = np.arange(len(scenario_labels))
         width = 0.35
         
         bars1 = ax.bar(x - width/2, pdr_means, width, label='packet delivery rate (%)', 
-                      color=COLORS[alg], alpha=0.8)
+                      color=color, alpha=0.8)
         
         # Créer un deuxième axe Y pour l'énergie
         ax2 = ax.twinx()
         bars2 = ax2.bar(x + width/2, energy_means, width, label='Énergie (mJ)', 
-                       color=COLORS[alg], alpha=0.4, hatch='//')
+                       color=color, alpha=0.4, hatch='//')
         
         ax.set_xlabel('Scénario', fontweight='bold')
         ax.set_ylabel('packet delivery rate (%)', fontweight='bold', color='black')
@@ -299,23 +791,16 @@ def plot_parameter_comparison(dfs_dict, output_dir='output'):
         
         ax.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/comparaison_scenarios.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f'{output_dir}/comparaison_scenarios.png', svg=svg)
     print(f"✓ Graphique sauvegardé: comparaison_scenarios.png")
 
 
-def plot_heatmap_pdr(df, scenario_name, output_dir='output'):
+def plot_heatmap_pdr(df, scenario_name, output_dir='output', svg=False):
     """
     Crée une heatmap du packet delivery rate en fonction de deux paramètres
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Identifier les paramètres variables
-    params = []
-    for col in ['MobilitySpeed', 'NumDevices', 'TrafficInterval', 'Sigma']:
-        if df[col].nunique() > 1:
-            params.append(col)
+    # Paramètres variables détectés au chargement
+    params = list(get_variable_params(df))
     
     if len(params) < 2:
         print(f"⚠ Pas assez de paramètres variables pour créer une heatmap pour {scenario_name}")
@@ -323,21 +808,24 @@ def plot_heatmap_pdr(df, scenario_name, output_dir='output'):
     
     param1, param2 = params[0], params[1]
     
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = reuse_figure((16, 12))
+    axes = fig.subplots(2, 2)
     fig.suptitle(f'Heatmap packet delivery rate - Scénario: {scenario_name.upper()}', 
                  fontsize=16, fontweight='bold')
     
-    for idx, alg in enumerate(['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']):
+    # Moyennes de tous les algorithmes en un seul groupby sur la catégorie
+    # `alg`, au lieu d'un masque df['alg'] == alg et d'un pivot_table par algorithme
+    means = df.groupby(['alg', param2, param1], observed=True)['PDR_Percent'].mean()
+    present = means.index.get_level_values('alg')
+    
+    for idx, alg in enumerate(ALGORITHMS):
         ax = axes[idx // 2, idx % 2]
         
         # Créer la matrice pour la heatmap
-        alg_data = df[df['alg'] == alg]
-        pivot_table = alg_data.pivot_table(
-            values='PDR_Percent',
-            index=param2,
-            columns=param1,
-            aggfunc='mean'
-        )
+        if alg in present:
+            pivot_table = means.xs(alg, level='alg').unstack(param1)
+        else:
+            pivot_table = pd.DataFrame(dtype=float)
         
         sns.heatmap(pivot_table, annot=True, fmt='.1f', cmap='RdYlGn', 
                ax=ax, cbar_kws={'label': 'packet delivery rate (%)'}, 
@@ -349,13 +837,12 @@ def plot_heatmap_pdr(df, scenario_name, output_dir='output'):
         # Ensure PDR axis ticks from 0..100
         ax.set_yticks(ax.get_yticks())
     
-    plt.tight_layout()
     out_name = f'heatmap_packet_delivery_rate_{scenario_name}.png'
-    plt.savefig(f'{output_dir}/{out_name}', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f'{output_dir}/{out_name}', svg=svg)
     print(f"✓ Graphique sauvegardé: {out_name}")
 
 
+@lru_cache(maxsize=None)
 def find_all_summary_paths(scenario):
     """Retourne une liste de chemins CSV trouvés pour un scénario en cherchant
     dans le répertoire courant, `resultsfinal/summaries/<scenario>/` et
@@ -373,14 +860,14 @@ def find_all_summary_paths(scenario):
         candidates_bases = [Path(base_name) / 'summaries', repo_root / base_name / 'summaries']
         for base in candidates_bases:
             alt = base / scenario
-            if alt.exists():
-                for p in alt.glob('*.csv'):
+            for p in _csv_index(base):
+                if p.parent == alt:
                     paths.append(str(p))
 
         # last resort: recursive search under each base
         for base in candidates_bases:
-            if base.exists():
-                for p in base.rglob(f'*{scenario}*.csv'):
+            for p in _csv_index(base):
+                if fnmatchcase(p.name, f'*{scenario}*.csv'):
                     paths.append(str(p))
 
     # remove duplicates while preserving order
@@ -393,39 +880,40 @@ def find_all_summary_paths(scenario):
     return unique
 
 
-def plot_energy_efficiency(df, scenario_name, output_dir='output'):
+def plot_energy_efficiency(df, scenario_name, output_dir='output', svg=False):
     """
     Calcule et affiche l'efficacité énergétique (packet delivery rate/Énergie)
     """
-    Path(output_dir).mkdir(exist_ok=True)
+    # Calculer l'efficacité énergétique sans modifier `df` (énergie nulle -> NaN,
+    # ignorée par la moyenne)
+    pdr = df['PDR_Percent'].to_numpy(dtype=float)
+    energy = df['AvgEnergy_mJ'].to_numpy(dtype=float)
+    efficiency = np.divide(pdr, energy, out=np.full_like(pdr, np.nan), where=energy != 0)
     
-    # Calculer l'efficacité énergétique
-    df['Efficiency'] = df['PDR_Percent'] / df['AvgEnergy_mJ']
+    fig = reuse_figure((12, 6))
+    ax = fig.subplots()
     
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
-    # Grouper par algorithme
-    efficiency_data = df.groupby('alg')['Efficiency'].agg(['mean', 'std']).reset_index()
+    # Grouper par algorithme (index déjà trié dans l'ordre des catégories,
+    # utilisé directement pour les couleurs et les étiquettes)
+    efficiency_data = (pd.Series(efficiency, index=df.index, name='Efficiency')
+                       .groupby(df['alg'], observed=True, sort=True).agg(['mean', 'std']))
     
     x = np.arange(len(efficiency_data))
     width = 0.6
     
+    # Couleurs des barres lues directement par code de catégorie
     bars = ax.bar(x, efficiency_data['mean'], width, 
                   yerr=efficiency_data['std'], 
-                  capsize=10, alpha=0.8)
-    
-    # Colorer les barres
-    for i, (bar, alg) in enumerate(zip(bars, efficiency_data['alg'])):
-        bar.set_color(COLORS[alg])
-        bar.set_edgecolor('black')
-        bar.set_linewidth(1.5)
+                  capsize=10, alpha=0.8,
+                  color=COLOR_ARR[style_codes(efficiency_data.index.codes)],
+                  edgecolor='black', linewidth=1.5)
     
     ax.set_xlabel('Algorithme', fontweight='bold', fontsize=12)
     ax.set_ylabel('Efficacité énergétique (packet delivery rate/mJ)', fontweight='bold', fontsize=12)
     ax.set_title(f'Efficacité énergétique - Scénario: {scenario_name.upper()}', 
                 fontweight='bold', fontsize=14)
     ax.set_xticks(x)
-    ax.set_xticklabels(efficiency_data['alg'])
+    ax.set_xticklabels(efficiency_data.index)
     ax.grid(True, alpha=0.3, axis='y')
     
     # Ajouter les valeurs sur les barres
@@ -435,345 +923,298 @@ def plot_energy_efficiency(df, scenario_name, output_dir='output'):
                 f'{val:.2f}\n±{std:.2f}',
                 ha='center', va='bottom', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/efficacite_energetique_{scenario_name}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f'{output_dir}/efficacite_energetique_{scenario_name}.png', svg=svg)
     print(f"✓ Graphique sauvegardé: efficacite_energetique_{scenario_name}.png")
 
 
-def plot_sigma_impact(df_sigma, output_dir='output'):
+def plot_sigma_impact(df_sigma, output_dir='output', svg=False):
     """
     Analyse l'impact du paramètre Sigma sur les performances
     """
-    Path(output_dir).mkdir(exist_ok=True)
+    algs = get_algs(df_sigma)
+    means = mean_by_alg(df_sigma, 'Sigma')
     
-    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    fig = reuse_figure((16, 6))
+    axes = fig.subplots(1, 2)
     fig.suptitle('Impact du paramètre Sigma (écart-type de shadow fading)', 
                  fontsize=16, fontweight='bold')
     
     # packet delivery rate en fonction de Sigma
     ax1 = axes[0]
-    for alg in df_sigma['alg'].unique():
-        alg_data = df_sigma[df_sigma['alg'] == alg].groupby('Sigma')['PDR_Percent'].mean().reset_index()
-        ax1.plot(alg_data['Sigma'], alg_data['PDR_Percent'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2.5, markersize=10)
+    ax1_handles = plot_alg_lines(ax1, curves_by_alg(means['PDR_Percent'], algs), linewidth=2.5, markersize=10)
     
     ax1.set_xlabel('Sigma (dB)', fontweight='bold', fontsize=12)
     ax1.set_ylabel('packet delivery rate (%)', fontweight='bold', fontsize=12)
     ax1.set_title('packet delivery rate vs Sigma', fontweight='bold')
     ax1.set_ylim(0, 100)
-    ax1.set_yticks(np.arange(0, 101, 20))
-    ax1.legend(loc='best')
+    ax1.set_yticks(PERCENT_TICKS)
+    ax1.legend(handles=ax1_handles, loc='best')
     ax1.grid(True, alpha=0.3)
     
     # Énergie en fonction de Sigma
     ax2 = axes[1]
-    for alg in df_sigma['alg'].unique():
-        alg_data = df_sigma[df_sigma['alg'] == alg].groupby('Sigma')['AvgEnergy_mJ'].mean().reset_index()
-        ax2.plot(alg_data['Sigma'], alg_data['AvgEnergy_mJ'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2.5, markersize=10)
+    ax2_handles = plot_alg_lines(ax2, curves_by_alg(means['AvgEnergy_mJ'], algs), linewidth=2.5, markersize=10)
     
     ax2.set_xlabel('Sigma (dB)', fontweight='bold', fontsize=12)
     ax2.set_ylabel('Énergie moyenne (mJ)', fontweight='bold', fontsize=12)
     ax2.set_title('Énergie vs Sigma', fontweight='bold')
-    ax2.legend(loc='best')
+    ax2.legend(handles=ax2_handles, loc='best')
     ax2.grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/impact_sigma.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f'{output_dir}/impact_sigma.png', svg=svg)
     print(f"✓ Graphique sauvegardé: impact_sigma.png")
 
 
-def plot_density_impact_mobility0(df_density, output_dir='output'):
+def format_num_devices(values):
+    """Valeurs distinctes triées de NumDevices jointes par des virgules (sans
+    '.0' pour les valeurs entières), ou None s'il n'y en a aucune."""
+    vals = np.unique(pd.to_numeric(values, errors='coerce').dropna().to_numpy())
+    if vals.size == 0:
+        return None
+    # formatage vectorisé: entiers d'un côté, flottants de l'autre
+    labels = np.where(vals % 1 == 0, vals.astype(np.int64).astype(str), vals.astype(str))
+    return ','.join(labels)
+
+
+def plot_density_impact_mobility0(df_density, output_dir='output', svg=False):
     """
     Trace l'impact de la densité (NumDevices) sur le packet delivery rate
     et l'énergie en filtrant uniquement les points où MobilitySpeed == 0.
     Sauvegarde des images séparées: `pdr_density_mob0.png` et `energy_density_mob0.png`.
     """
-    Path(output_dir).mkdir(exist_ok=True)
-
-    # Filter for MobilitySpeed == 0 (tolerate numeric strings)
+    # Filter for MobilitySpeed == 0 (column made numeric by load_data)
     if 'MobilitySpeed' in df_density.columns:
-        dff = df_density.copy()
-        dff['MobilitySpeed'] = pd.to_numeric(dff['MobilitySpeed'], errors='coerce')
-        dff = dff[dff['MobilitySpeed'] == 0.0]
+        dff = df_density.loc[df_density['MobilitySpeed'] == 0.0]
     else:
-        dff = df_density.copy()
+        dff = df_density
 
     if dff.empty:
         print("⚠ Pas de données avec MobilitySpeed == 0 pour l'impact densité")
         return
 
+    means = mean_by_alg(dff, 'NumDevices')
+    nd_str = format_num_devices(dff['NumDevices'])
+
     # PDR vs NumDevices (separate plot)
-    plt.figure(figsize=(10, 6))
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in dff['alg'].unique():
-            continue
-        grp = dff[dff['alg'] == alg].groupby('NumDevices')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='NumDevices')
-        plt.plot(grp['NumDevices'], grp['PDR_Percent'], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2)
+    plt.figure(reuse_figure((10, 6)))
+    handles = plot_alg_lines(plt.gca(), curves_by_alg(means['PDR_Percent']), linewidth=2)
 
     plt.xlabel('NumDevices', fontweight='bold')
     plt.ylabel('packet delivery rate (%)', fontweight='bold')
     plt.title('Impact densité: packet delivery rate vs NumDevices (MobilitySpeed=0)', fontweight='bold')
     plt.xlim(100, 1000)
-    plt.xticks(np.arange(100, 1001, 100))
+    plt.xticks(NUM_DEVICES_TICKS)
     plt.ylim(0, 100)
-    plt.yticks(np.arange(0, 101, 20))
+    plt.yticks(PERCENT_TICKS)
     plt.grid(True)
-    plt.legend()
+    plt.legend(handles=handles)
 
     # Annotate NumDevices present
-    try:
-        nd_vals = sorted(pd.to_numeric(dff['NumDevices'], errors='coerce').dropna().unique())
-        if len(nd_vals) > 0:
-            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-            plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-    except Exception:
-        pass
+    if nd_str is not None:
+        plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
     out_pdr = f'{output_dir}/pdr_density_mob0.png'
-    plt.tight_layout()
-    plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), out_pdr, svg=svg)
     print(f"✓ Graphique sauvegardé: {out_pdr}")
 
     # Energy vs NumDevices (separate plot)
-    plt.figure(figsize=(10, 6))
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in dff['alg'].unique():
-            continue
-        grp = dff[dff['alg'] == alg].groupby('NumDevices')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='NumDevices')
-        plt.plot(grp['NumDevices'], grp['AvgEnergy_mJ'], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2)
+    plt.figure(reuse_figure((10, 6)))
+    handles = plot_alg_lines(plt.gca(), curves_by_alg(means['AvgEnergy_mJ']), linewidth=2)
 
     plt.xlabel('NumDevices', fontweight='bold')
     plt.ylabel('Énergie moyenne (mJ)', fontweight='bold')
     plt.title('Impact densité: Énergie vs NumDevices (MobilitySpeed=0)', fontweight='bold')
     plt.xlim(100, 1000)
-    plt.xticks(np.arange(100, 1001, 100))
+    plt.xticks(NUM_DEVICES_TICKS)
     plt.grid(True)
-    plt.legend()
+    plt.legend(handles=handles)
 
     # Annotate NumDevices present
-    try:
-        nd_vals = sorted(pd.to_numeric(dff['NumDevices'], errors='coerce').dropna().unique())
-        if len(nd_vals) > 0:
-            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-            plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-    except Exception:
-        pass
+    if nd_str is not None:
+        plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
     out_energy = f'{output_dir}/energy_density_mob0.png'
-    plt.tight_layout()
-    plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), out_energy, svg=svg)
     print(f"✓ Graphique sauvegardé: {out_energy}")
 
 
-def plot_traffic_impact_mobility0(df_traffic, output_dir='output'):
+def plot_traffic_impact_mobility0(df_traffic, output_dir='output', svg=False):
     """
     Trace l'impact de l'intervalle de trafic (TrafficInterval) sur PDR et Énergie
     en filtrant MobilitySpeed == 0. Sauvegarde des images séparées: `pdr_traffic_mob0.png` et `energy_traffic_mob0.png`.
     """
-    Path(output_dir).mkdir(exist_ok=True)
-
     if 'MobilitySpeed' in df_traffic.columns:
-        dff = df_traffic.copy()
-        dff['MobilitySpeed'] = pd.to_numeric(dff['MobilitySpeed'], errors='coerce')
-        dff = dff[dff['MobilitySpeed'] == 0.0]
+        dff = df_traffic.loc[df_traffic['MobilitySpeed'] == 0.0]
     else:
-        dff = df_traffic.copy()
+        dff = df_traffic
 
     if dff.empty:
         print("⚠ Pas de données avec MobilitySpeed == 0 pour l'impact trafic")
         return
 
+    means = mean_by_alg(dff, 'TrafficInterval')
+    nd_str = format_num_devices(dff['NumDevices'])
+
     # PDR vs TrafficInterval (separate plot)
-    plt.figure(figsize=(10, 6))
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in dff['alg'].unique():
-            continue
-        grp = dff[dff['alg'] == alg].groupby('TrafficInterval')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='TrafficInterval')
-        plt.plot(grp['TrafficInterval'], grp['PDR_Percent'], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2)
+    plt.figure(reuse_figure((10, 6)))
+    handles = plot_alg_lines(plt.gca(), curves_by_alg(means['PDR_Percent']), linewidth=2)
 
     plt.xlabel('Intervalle de trafic (s)', fontweight='bold')
     plt.ylabel('packet delivery rate (%)', fontweight='bold')
     plt.title('Impact trafic: packet delivery rate vs TrafficInterval (MobilitySpeed=0)', fontweight='bold')
     plt.xlim(72, 3600)
-    plt.xticks([72, 300, 600, 900, 1200, 1800, 2400, 3600])
+    plt.xticks(TRAFFIC_SECONDS)
     plt.ylim(0, 100)
-    plt.yticks(np.arange(0, 101, 20))
+    plt.yticks(PERCENT_TICKS)
     plt.grid(True, alpha=0.3)
-    plt.legend()
+    plt.legend(handles=handles)
 
     # Annotate NumDevices present
-    try:
-        nd_vals = sorted(pd.to_numeric(dff['NumDevices'], errors='coerce').dropna().unique())
-        if len(nd_vals) > 0:
-            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-            plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-    except Exception:
-        pass
+    if nd_str is not None:
+        plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
     out_pdr = f'{output_dir}/pdr_traffic_mob0.png'
-    plt.tight_layout()
-    plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), out_pdr, svg=svg)
     print(f"✓ Graphique sauvegardé: {out_pdr}")
 
     # Energy vs TrafficInterval (separate plot)
-    plt.figure(figsize=(10, 6))
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in dff['alg'].unique():
-            continue
-        grp = dff[dff['alg'] == alg].groupby('TrafficInterval')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='TrafficInterval')
-        plt.plot(grp['TrafficInterval'], grp['AvgEnergy_mJ'], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2)
+    plt.figure(reuse_figure((10, 6)))
+    handles = plot_alg_lines(plt.gca(), curves_by_alg(means['AvgEnergy_mJ']), linewidth=2)
 
     plt.xlabel('Intervalle de trafic (s)', fontweight='bold')
     plt.ylabel('Énergie moyenne (mJ)', fontweight='bold')
     plt.title('Impact trafic: Énergie vs TrafficInterval (MobilitySpeed=0)', fontweight='bold')
     plt.xlim(72, 3600)
-    plt.xticks([72, 300, 600, 900, 1200, 1800, 2400, 3600])
+    plt.xticks(TRAFFIC_SECONDS)
     plt.grid(True, alpha=0.3)
-    plt.legend()
+    plt.legend(handles=handles)
 
     # Annotate NumDevices present
-    try:
-        nd_vals = sorted(pd.to_numeric(dff['NumDevices'], errors='coerce').dropna().unique())
-        if len(nd_vals) > 0:
-            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-            plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-    except Exception:
-        pass
+    if nd_str is not None:
+        plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
     out_energy = f'{output_dir}/energy_traffic_mob0.png'
-    plt.tight_layout()
-    plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), out_energy, svg=svg)
     print(f"✓ Graphique sauvegardé: {out_energy}")
 
 
-def plot_sigma_impact_mobility0(df_sigma, output_dir='output'):
+def plot_sigma_impact_mobility0(df_sigma, output_dir='output', svg=False):
     """
     Trace l'impact du paramètre Sigma sur PDR et Énergie
     en filtrant MobilitySpeed == 0. Sauvegarde des images séparées: `pdr_sigma_mob0.png` et `energy_sigma_mob0.png`.
     """
-    Path(output_dir).mkdir(exist_ok=True)
-
     if 'MobilitySpeed' in df_sigma.columns:
-        dff = df_sigma.copy()
-        dff['MobilitySpeed'] = pd.to_numeric(dff['MobilitySpeed'], errors='coerce')
-        dff = dff[dff['MobilitySpeed'] == 0.0]
+        dff = df_sigma.loc[df_sigma['MobilitySpeed'] == 0.0]
     else:
-        dff = df_sigma.copy()
+        dff = df_sigma
 
     if dff.empty:
         print("⚠ Pas de données avec MobilitySpeed == 0 pour l'impact sigma")
         return
 
+    means = mean_by_alg(dff, 'Sigma')
+    nd_str = format_num_devices(dff['NumDevices'])
+
     # PDR vs Sigma (separate plot)
-    plt.figure(figsize=(10, 6))
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in dff['alg'].unique():
-            continue
-        grp = dff[dff['alg'] == alg].groupby('Sigma')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='Sigma')
-        plt.plot(grp['Sigma'], grp['PDR_Percent'], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2.5, markersize=10)
+    plt.figure(reuse_figure((10, 6)))
+    handles = plot_alg_lines(plt.gca(), curves_by_alg(means['PDR_Percent']), linewidth=2.5, markersize=10)
 
     plt.xlabel('Sigma (dB)', fontweight='bold')
     plt.ylabel('packet delivery rate (%)', fontweight='bold')
     plt.title('Impact Sigma: packet delivery rate vs Sigma (MobilitySpeed=0)', fontweight='bold')
     plt.ylim(0, 100)
-    plt.yticks(np.arange(0, 101, 20))
+    plt.yticks(PERCENT_TICKS)
     plt.grid(True, alpha=0.3)
-    plt.legend()
+    plt.legend(handles=handles)
 
     # Annotate NumDevices present
-    try:
-        nd_vals = sorted(pd.to_numeric(dff['NumDevices'], errors='coerce').dropna().unique())
-        if len(nd_vals) > 0:
-            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-            plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-    except Exception:
-        pass
+    if nd_str is not None:
+        plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
     out_pdr = f'{output_dir}/pdr_sigma_mob0.png'
-    plt.tight_layout()
-    plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), out_pdr, svg=svg)
     print(f"✓ Graphique sauvegardé: {out_pdr}")
 
     # Energy vs Sigma (separate plot)
-    plt.figure(figsize=(10, 6))
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in dff['alg'].unique():
-            continue
-        grp = dff[dff['alg'] == alg].groupby('Sigma')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='Sigma')
-        plt.plot(grp['Sigma'], grp['AvgEnergy_mJ'], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2.5, markersize=10)
+    plt.figure(reuse_figure((10, 6)))
+    handles = plot_alg_lines(plt.gca(), curves_by_alg(means['AvgEnergy_mJ']), linewidth=2.5, markersize=10)
 
     plt.xlabel('Sigma (dB)', fontweight='bold')
     plt.ylabel('Énergie moyenne (mJ)', fontweight='bold')
     plt.title('Impact Sigma: Énergie vs Sigma (MobilitySpeed=0)', fontweight='bold')
     plt.grid(True, alpha=0.3)
-    plt.legend()
+    plt.legend(handles=handles)
 
     # Annotate NumDevices present
-    try:
-        nd_vals = sorted(pd.to_numeric(dff['NumDevices'], errors='coerce').dropna().unique())
-        if len(nd_vals) > 0:
-            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-            plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-    except Exception:
-        pass
+    if nd_str is not None:
+        plt.gca().text(0.99, 0.02, f'NumDevices présents: {nd_str}', transform=plt.gca().transAxes, ha='right', va='bottom', fontsize=9, bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
     out_energy = f'{output_dir}/energy_sigma_mob0.png'
-    plt.tight_layout()
-    plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(plt.gcf(), out_energy, svg=svg)
     print(f"✓ Graphique sauvegardé: {out_energy}")
 
 
-def plot_traffic_impact_fixed_params(dfs_dict, output_dir='output'):
+def plot_metric_by_alg(means, metric, out_path, xlabel, ylabel, title, x_transform=None,
+                       xlim=None, xticks=None, xticklabels=None, ylim=None, yticks=None,
+                       svg=False):
+    """Trace une métrique de `means` (table de `mean_by_alg`) pour chaque
+    algorithme et sauvegarde la figure dans `out_path`.
+
+    Corps commun aux graphiques à paramètres fixes (PDR ou énergie vs un
+    paramètre). `x_transform` s'applique aux abscisses de chaque courbe (ex.
+    intervalle -> messages par heure). Retourne False, sans rien sauvegarder,
+    si aucune courbe n'est disponible. `svg` ajoute une copie .svg.
+    """
+    curves = curves_by_alg(means[metric])
+    if x_transform is not None:
+        curves = {alg: (x_transform(x), y) for alg, (x, y) in curves.items()}
+    if not curves:
+        return False
+
+    # Figure identique à celle déjà sur disque: pas de nouveau rendu
+    digest = figure_digest(curves, metric, xlabel, ylabel, title, xlim, xticks, xticklabels, ylim, yticks,
+                           svg=svg)
+    if figure_is_current(out_path, digest, svg=svg):
+        print(f"✓ Graphique inchangé: {out_path}")
+        return True
+
+    # Figure/Axes réutilisés d'un graphique à l'autre (API objet, sans pyplot)
+    fig, ax = reuse_axes((10, 6))
+    handles = plot_alg_lines(ax, curves, linewidth=2.5, markersize=8)
+    ax.set_xlabel(xlabel, fontweight='bold')
+    ax.set_ylabel(ylabel, fontweight='bold')
+    ax.set_title(title, fontweight='bold')
+    if xlim is not None:
+        ax.set_xlim(*xlim)
+    if xticks is not None:
+        ax.set_xticks(xticks, xticklabels)
+    if ylim is not None:
+        ax.set_ylim(*ylim)
+    if yticks is not None:
+        ax.set_yticks(yticks)
+    ax.grid(True, alpha=0.3)
+    ax.legend(handles=handles)
+
+    save_figure(fig, out_path, digest=digest, svg=svg)
+    print(f"✓ Graphique sauvegardé: {out_path}")
+    return True
+
+
+def messages_per_hour(traffic_interval):
+    """Convertit un intervalle de trafic (s) en messages par heure."""
+    return 3600 / traffic_interval
+
+
+def plot_traffic_impact_fixed_params(dfs_dict, output_dir='output', svg=False):
     """
     Génère 2 graphiques: PDR et énergie en fonction de l'intervalle de trafic
     avec MobilitySpeed=0, NumDevices=550 et Sigma=3.96
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Utiliser toutes les données disponibles (combiner tous les scénarios)
-    all_df_list = []
-    for scenario_name, df in dfs_dict.items():
-        all_df_list.append(df)
-    
-    if not all_df_list:
+    # Utiliser toutes les données disponibles (tous les scénarios, concaténés une seule fois)
+    all_df = combine_scenarios(dfs_dict)
+    if all_df is None:
         print("⚠ Aucune donnée disponible pour l'analyse de l'intervalle de trafic")
         return
-        
-    all_df = pd.concat(all_df_list, ignore_index=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in all_df.columns:
-            all_df[col] = pd.to_numeric(all_df[col], errors='coerce')
     
     # Paramètres fixes
     mobility_speed = 0
@@ -781,115 +1222,44 @@ def plot_traffic_impact_fixed_params(dfs_dict, output_dir='output'):
     sigma = 3.96
     
     # Filtrer les données selon les paramètres spécifiés
-    filtered = all_df[
-        (all_df['MobilitySpeed'] == mobility_speed) &
-        (all_df['NumDevices'] == num_devices) &
-        (all_df['Sigma'] == sigma)
-    ]
+    filtered = all_df.query("MobilitySpeed == @mobility_speed and NumDevices == @num_devices and Sigma == @sigma")
     
     if filtered.empty:
         print(f"⚠ Pas de données pour MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma}")
         return
+
+    # Moyennes directement en messages par heure (colonne précalculée)
+    means = mean_by_alg(filtered, 'MessagesPerHour')
     
-    # PDR vs TrafficInterval
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('TrafficInterval')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='TrafficInterval')
-        # Convertir en messages par heure
-        grp['MessagesPerHour'] = 3600 / grp['TrafficInterval']
-        plt.plot(grp['MessagesPerHour'], grp['PDR_Percent'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        # Définir les ticks en messages par heure
-        traffic_seconds = [72, 300, 600, 900, 1200, 1800, 2400, 3600]
-        messages_per_hour_ticks = [int(3600/t) for t in traffic_seconds]
-        plt.xlabel('Messages per Hour', fontweight='bold')
-        plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Messages per Hour (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma})', fontweight='bold')
-        plt.xlim(1, 50)
-        plt.xticks(messages_per_hour_ticks, [f'{m}' for m in messages_per_hour_ticks])
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/traffic_pdr_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
-    else:
-        plt.close()
+    params = f'MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma}'
+    # Ticks en messages par heure
+    axes_opts = dict(xlim=(1, 50), xticks=TRAFFIC_MSGS_PER_HOUR,
+                     xticklabels=TRAFFIC_XTICK_LABELS)
     
-    # Energy vs TrafficInterval
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('TrafficInterval')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='TrafficInterval')
-        # Convertir en messages par heure
-        grp['MessagesPerHour'] = 3600 / grp['TrafficInterval']
-        plt.plot(grp['MessagesPerHour'], grp['AvgEnergy_mJ'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        # Définir les ticks en messages par heure
-        traffic_seconds = [72, 300, 600, 900, 1200, 1800, 2400, 3600]
-        messages_per_hour_ticks = [int(3600/t) for t in traffic_seconds]
-        plt.xlabel('Messages per Hour', fontweight='bold')
-        plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-        plt.title(f'Energy vs Messages per Hour (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma})', fontweight='bold')
-        plt.xlim(1, 50)
-        plt.xticks(messages_per_hour_ticks, [f'{m}' for m in messages_per_hour_ticks])
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/traffic_energy_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
-    else:
-        plt.close()
+    # PDR vs TrafficInterval (en messages par heure)
+    plot_metric_by_alg(means, 'PDR_Percent',
+                       f'{output_dir}/traffic_pdr_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png',
+                       'Messages per Hour', 'Packet Delivery Rate (%)',
+                       f'PDR vs Messages per Hour ({params})',
+                       ylim=(0, 100), yticks=PERCENT_TICKS, **axes_opts, svg=svg)
+    
+    # Energy vs TrafficInterval (en messages par heure)
+    plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                       f'{output_dir}/traffic_energy_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png',
+                       'Messages per Hour', 'Energy Consumption (mJ)',
+                       f'Energy vs Messages per Hour ({params})', **axes_opts, svg=svg)
 
 
-def plot_sigma_impact_fixed_params(dfs_dict, output_dir='output'):
+def plot_sigma_impact_fixed_params(dfs_dict, output_dir='output', svg=False):
     """
     Génère 2 graphiques: PDR et énergie en fonction de Sigma (canal de saturation)
     avec MobilitySpeed=0, NumDevices=550 et TrafficInterval=3600
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Utiliser toutes les données disponibles (combiner tous les scénarios)
-    all_df_list = []
-    for scenario_name, df in dfs_dict.items():
-        all_df_list.append(df)
-    
-    if not all_df_list:
+    # Utiliser toutes les données disponibles (tous les scénarios, concaténés une seule fois)
+    all_df = combine_scenarios(dfs_dict)
+    if all_df is None:
         print("⚠ Aucune donnée disponible pour l'analyse de sigma")
         return
-        
-    all_df = pd.concat(all_df_list, ignore_index=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in all_df.columns:
-            all_df[col] = pd.to_numeric(all_df[col], errors='coerce')
     
     # Paramètres fixes
     mobility_speed = 0
@@ -897,101 +1267,37 @@ def plot_sigma_impact_fixed_params(dfs_dict, output_dir='output'):
     traffic_interval = 3600
     
     # Filtrer les données selon les paramètres spécifiés
-    filtered = all_df[
-        (all_df['MobilitySpeed'] == mobility_speed) &
-        (all_df['NumDevices'] == num_devices) &
-        (all_df['TrafficInterval'] == traffic_interval)
-    ]
+    filtered = all_df.query("MobilitySpeed == @mobility_speed and NumDevices == @num_devices and TrafficInterval == @traffic_interval")
     
     if filtered.empty:
         print(f"⚠ Pas de données pour MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}")
         return
+
+    means = mean_by_alg(filtered, 'Sigma')
+    params = f'MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s'
     
     # PDR vs Sigma
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('Sigma')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='Sigma')
-        plt.plot(grp['Sigma'], grp['PDR_Percent'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Sigma (dB)', fontweight='bold')
-        plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Sigma (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s)', fontweight='bold')
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/sigma_pdr_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'PDR_Percent',
+                       f'{output_dir}/sigma_pdr_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png',
+                       'Sigma (dB)', 'Packet Delivery Rate (%)', f'PDR vs Sigma ({params})',
+                       ylim=(0, 100), yticks=PERCENT_TICKS, svg=svg)
     
     # Energy vs Sigma
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('Sigma')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='Sigma')
-        plt.plot(grp['Sigma'], grp['AvgEnergy_mJ'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Sigma (dB)', fontweight='bold')
-        plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-        plt.title(f'Energy vs Sigma (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s)', fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/sigma_energy_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                       f'{output_dir}/sigma_energy_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png',
+                       'Sigma (dB)', 'Energy Consumption (mJ)', f'Energy vs Sigma ({params})', svg=svg)
 
 
-def plot_density_impact_fixed_params(dfs_dict, output_dir='output'):
+def plot_density_impact_fixed_params(dfs_dict, output_dir='output', svg=False):
     """
     Génère 2 graphiques: PDR et énergie en fonction de la densité
     avec MobilitySpeed=0, TrafficInterval=3600 et Sigma=3.96
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Utiliser toutes les données disponibles (combiner tous les scénarios)
-    all_df_list = []
-    for scenario_name, df in dfs_dict.items():
-        all_df_list.append(df)
-    
-    if not all_df_list:
+    # Utiliser toutes les données disponibles (tous les scénarios, concaténés une seule fois)
+    all_df = combine_scenarios(dfs_dict)
+    if all_df is None:
         print("⚠ Aucune donnée disponible pour l'analyse de densité")
         return
-        
-    all_df = pd.concat(all_df_list, ignore_index=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in all_df.columns:
-            all_df[col] = pd.to_numeric(all_df[col], errors='coerce')
     
     # Paramètres fixes
     mobility_speed = 0
@@ -999,94 +1305,35 @@ def plot_density_impact_fixed_params(dfs_dict, output_dir='output'):
     sigma = 3.96
     
     # Filtrer les données selon les paramètres spécifiés
-    filtered = all_df[
-        (all_df['MobilitySpeed'] == mobility_speed) &
-        (all_df['TrafficInterval'] == traffic_interval) &
-        (all_df['Sigma'] == sigma)
-    ]
+    filtered = all_df.query("MobilitySpeed == @mobility_speed and TrafficInterval == @traffic_interval and Sigma == @sigma")
     
     if filtered.empty:
         print(f"⚠ Pas de données pour MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma}")
         return
+
+    means = mean_by_alg(filtered, 'NumDevices')
+    params = f'MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma}'
+    axes_opts = dict(xlim=(100, 1000), xticks=NUM_DEVICES_TICKS)
     
     # PDR vs NumDevices
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('NumDevices')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='NumDevices')
-        plt.plot(grp['NumDevices'], grp['PDR_Percent'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Number of Nodes', fontweight='bold')
-        plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Node Density (MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma})', fontweight='bold')
-        plt.xlim(100, 1000)
-        plt.xticks(np.arange(100, 1001, 100))
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/density_pdr_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'PDR_Percent',
+                       f'{output_dir}/density_pdr_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png',
+                       'Number of Nodes', 'Packet Delivery Rate (%)', f'PDR vs Node Density ({params})',
+                       ylim=(0, 100), yticks=PERCENT_TICKS, **axes_opts, svg=svg)
     
     # Energy vs NumDevices
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('NumDevices')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='NumDevices')
-        plt.plot(grp['NumDevices'], grp['AvgEnergy_mJ'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Number of Nodes', fontweight='bold')
-        plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-        plt.title(f'Energy vs Node Density (MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma})', fontweight='bold')
-        plt.xlim(100, 1000)
-        plt.xticks(np.arange(100, 1001, 100))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/density_energy_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                       f'{output_dir}/density_energy_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png',
+                       'Number of Nodes', 'Energy Consumption (mJ)', f'Energy vs Node Density ({params})',
+                       **axes_opts, svg=svg)
 
 
-def plot_density_scenario_specific(df_density, output_dir='output'):
+def plot_density_scenario_specific(df_density, output_dir='output', svg=False):
     """
     Génère 2 graphiques pour le scénario density: PDR et énergie en fonction de la densité
     avec MobilitySpeed=0, TrafficInterval=3600 et Sigma=3.96
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in df_density.columns:
-            df_density[col] = pd.to_numeric(df_density[col], errors='coerce')
+    # Colonnes numériques: déjà converties une seule fois par load_data
     
     # Paramètres fixes
     mobility_speed = 0
@@ -1094,94 +1341,36 @@ def plot_density_scenario_specific(df_density, output_dir='output'):
     sigma = 3.96
     
     # Filtrer les données selon les paramètres spécifiés
-    filtered = df_density[
-        (df_density['MobilitySpeed'] == mobility_speed) &
-        (df_density['TrafficInterval'] == traffic_interval) &
-        (df_density['Sigma'] == sigma)
-    ]
+    filtered = df_density.query("MobilitySpeed == @mobility_speed and TrafficInterval == @traffic_interval and Sigma == @sigma")
     
     if filtered.empty:
         print(f"⚠ Pas de données pour le scénario density avec MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma}")
         return
+
+    means = mean_by_alg(filtered, 'NumDevices')
+    params = f'MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma}'
+    axes_opts = dict(xlim=(100, 1000), xticks=NUM_DEVICES_TICKS)
     
     # PDR vs NumDevices
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('NumDevices')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='NumDevices')
-        plt.plot(grp['NumDevices'], grp['PDR_Percent'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Number of Nodes', fontweight='bold')
-        plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Node Density - Density Scenario (MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma})', fontweight='bold')
-        plt.xlim(100, 1000)
-        plt.xticks(np.arange(100, 1001, 100))
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/density_scenario_pdr_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'PDR_Percent',
+                       f'{output_dir}/density_scenario_pdr_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png',
+                       'Number of Nodes', 'Packet Delivery Rate (%)',
+                       f'PDR vs Node Density - Density Scenario ({params})',
+                       ylim=(0, 100), yticks=PERCENT_TICKS, **axes_opts, svg=svg)
     
     # Energy vs NumDevices
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('NumDevices')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='NumDevices')
-        plt.plot(grp['NumDevices'], grp['AvgEnergy_mJ'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Number of Nodes', fontweight='bold')
-        plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-        plt.title(f'Energy vs Node Density - Density Scenario (MobilitySpeed={mobility_speed}, TrafficInterval={traffic_interval}s, Sigma={sigma})', fontweight='bold')
-        plt.xlim(100, 1000)
-        plt.xticks(np.arange(100, 1001, 100))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/density_scenario_energy_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                       f'{output_dir}/density_scenario_energy_mobility{mobility_speed}_traffic{traffic_interval}_sigma{sigma}.png',
+                       'Number of Nodes', 'Energy Consumption (mJ)',
+                       f'Energy vs Node Density - Density Scenario ({params})', **axes_opts, svg=svg)
 
 
-def plot_sigma_scenario_specific(df_sigma, output_dir='output'):
+def plot_sigma_scenario_specific(df_sigma, output_dir='output', svg=False):
     """
     Génère 2 graphiques pour le scénario sigma: PDR et énergie en fonction de Sigma
     avec MobilitySpeed=0, NumDevices=550 et TrafficInterval=3600
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in df_sigma.columns:
-            df_sigma[col] = pd.to_numeric(df_sigma[col], errors='coerce')
+    # Colonnes numériques: déjà converties une seule fois par load_data
     
     # Paramètres fixes
     mobility_speed = 0
@@ -1189,90 +1378,34 @@ def plot_sigma_scenario_specific(df_sigma, output_dir='output'):
     traffic_interval = 3600
     
     # Filtrer les données selon les paramètres spécifiés
-    filtered = df_sigma[
-        (df_sigma['MobilitySpeed'] == mobility_speed) &
-        (df_sigma['NumDevices'] == num_devices) &
-        (df_sigma['TrafficInterval'] == traffic_interval)
-    ]
+    filtered = df_sigma.query("MobilitySpeed == @mobility_speed and NumDevices == @num_devices and TrafficInterval == @traffic_interval")
     
     if filtered.empty:
         print(f"⚠ Pas de données pour le scénario sigma avec MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s")
         return
+
+    means = mean_by_alg(filtered, 'Sigma')
+    params = f'MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s'
     
     # PDR vs Sigma
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('Sigma')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='Sigma')
-        plt.plot(grp['Sigma'], grp['PDR_Percent'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Sigma (dB)', fontweight='bold')
-        plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Sigma - Sigma Scenario (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s)', fontweight='bold')
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/sigma_scenario_pdr_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'PDR_Percent',
+                       f'{output_dir}/sigma_scenario_pdr_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png',
+                       'Sigma (dB)', 'Packet Delivery Rate (%)', f'PDR vs Sigma - Sigma Scenario ({params})',
+                       ylim=(0, 100), yticks=PERCENT_TICKS, svg=svg)
     
     # Energy vs Sigma
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('Sigma')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='Sigma')
-        plt.plot(grp['Sigma'], grp['AvgEnergy_mJ'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Sigma (dB)', fontweight='bold')
-        plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-        plt.title(f'Energy vs Sigma - Sigma Scenario (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, TrafficInterval={traffic_interval}s)', fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/sigma_scenario_energy_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
-    else:
-        plt.close()
+    plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                       f'{output_dir}/sigma_scenario_energy_mobility{mobility_speed}_density{num_devices}_traffic{traffic_interval}.png',
+                       'Sigma (dB)', 'Energy Consumption (mJ)', f'Energy vs Sigma - Sigma Scenario ({params})',
+                       svg=svg)
 
 
-def plot_traffic_scenario_specific(df_traffic, output_dir='output'):
+def plot_traffic_scenario_specific(df_traffic, output_dir='output', svg=False):
     """
     Génère 2 graphiques pour le scénario intervalle_d_envoie: PDR et énergie en fonction de TrafficInterval
     avec MobilitySpeed=0, NumDevices=550 et Sigma=3.96, puis avec NumDevices=1000
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in df_traffic.columns:
-            df_traffic[col] = pd.to_numeric(df_traffic[col], errors='coerce')
+    # Colonnes numériques: déjà converties une seule fois par load_data
     
     # Paramètres fixes communs
     mobility_speed = 0
@@ -1284,102 +1417,45 @@ def plot_traffic_scenario_specific(df_traffic, output_dir='output'):
     for num_devices in densities:
         
         # Filtrer les données selon les paramètres spécifiés
-        filtered = df_traffic[
-            (df_traffic['MobilitySpeed'] == mobility_speed) &
-            (df_traffic['NumDevices'] == num_devices) &
-            (df_traffic['Sigma'] == sigma)
-        ]
+        filtered = df_traffic.query("MobilitySpeed == @mobility_speed and NumDevices == @num_devices and Sigma == @sigma")
         
         if filtered.empty:
             print(f"⚠ Pas de données pour le scénario intervalle_d_envoie avec MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma}")
             continue
-        
-        # Définir les ticks pour TrafficInterval et convertir en messages par heure
-        traffic_ticks = [72, 360, 1800, 3600]
-        messages_per_hour = [int(3600/t) for t in traffic_ticks]  # Conversion en messages/heure
-        
-        # PDR vs TrafficInterval (en messages par heure)
-        plt.figure(figsize=(10, 6))
-        plotted = False
-        for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-            if alg not in filtered['alg'].unique():
-                continue
-            grp = filtered[filtered['alg'] == alg].groupby('TrafficInterval')['PDR_Percent'].mean().reset_index()
-            if grp.empty:
-                continue
-            grp = grp.sort_values(by='TrafficInterval')
-            # Convertir TrafficInterval en messages par heure pour l'affichage
-            grp['MessagesPerHour'] = 3600 / grp['TrafficInterval']
-            plt.plot(grp['MessagesPerHour'], grp['PDR_Percent'], 
-                    marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                    label=alg, linewidth=2.5, markersize=8)
-            plotted = True
-        
-        if plotted:
-            plt.xlabel('Messages per Hour', fontweight='bold')
-            plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-            plt.title(f'PDR vs Messages per Hour - Traffic Scenario (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma})', fontweight='bold')
-            plt.ylim(0, 100)
-            plt.yticks(np.arange(0, 101, 20))
-            plt.xlim(1, 60)
-            plt.xticks(messages_per_hour, [f'{m} messages per hour' for m in messages_per_hour])
-            plt.grid(True, alpha=0.3)
-            plt.legend()
-            
-            out_pdr = f'{output_dir}/traffic_scenario_pdr_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png'
-            plt.tight_layout()
-            plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-            plt.close()
-            print(f"✓ Graphique sauvegardé: {out_pdr}")
-        else:
-            plt.close()
-        
-        # Energy vs TrafficInterval (en messages par heure)
-        plt.figure(figsize=(10, 6))
-        plotted = False
-        for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-            if alg not in filtered['alg'].unique():
-                continue
-            grp = filtered[filtered['alg'] == alg].groupby('TrafficInterval')['AvgEnergy_mJ'].mean().reset_index()
-            if grp.empty:
-                continue
-            grp = grp.sort_values(by='TrafficInterval')
-            # Convertir TrafficInterval en messages par heure pour l'affichage
-            grp['MessagesPerHour'] = 3600 / grp['TrafficInterval']
-            plt.plot(grp['MessagesPerHour'], grp['AvgEnergy_mJ'], 
-                    marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                    label=alg, linewidth=2.5, markersize=8)
-            plotted = True
-        
-        if plotted:
-            plt.xlabel('Messages per Hour', fontweight='bold')
-            plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-            plt.title(f'Energy vs Messages per Hour - Traffic Scenario (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma})', fontweight='bold')
-            plt.xlim(1, 60)
-            plt.xticks(messages_per_hour, [f'{m} messages per hour' for m in messages_per_hour])
-            plt.grid(True, alpha=0.3)
-            plt.legend()
-            
-            out_energy = f'{output_dir}/traffic_scenario_energy_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png'
-            plt.tight_layout()
-            plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-            plt.close()
-            print(f"✓ Graphique sauvegardé: {out_energy}")
-        else:
-            plt.close()
+
+        means = mean_by_alg(filtered, 'TrafficInterval')
+        _plot_traffic_scenario(means, mobility_speed, num_devices, sigma, output_dir, svg=svg)
 
 
-def plot_traffic_scenario_mobility33(df_traffic, output_dir='output'):
+def _plot_traffic_scenario(means, mobility_speed, num_devices, sigma, output_dir, svg=False):
+    """PDR et énergie en messages par heure pour le scénario intervalle_d_envoie
+    (commun à plot_traffic_scenario_specific et plot_traffic_scenario_mobility33)."""
+    # Titres sur deux lignes: sur une seule, ils dépassent la largeur de la figure
+    params = f'MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma}'
+    # Ticks en messages par heure
+    axes_opts = dict(x_transform=messages_per_hour, xlim=(1, 60), xticks=TRAFFIC_SCENARIO_MSGS_PER_HOUR,
+                     xticklabels=TRAFFIC_SCENARIO_XTICK_LABELS)
+
+    # PDR vs TrafficInterval (en messages par heure)
+    plot_metric_by_alg(means, 'PDR_Percent',
+                       f'{output_dir}/traffic_scenario_pdr_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png',
+                       'Messages per Hour', 'Packet Delivery Rate (%)',
+                       f'PDR vs Messages per Hour - Traffic Scenario\n({params})',
+                       ylim=(0, 100), yticks=PERCENT_TICKS, **axes_opts, svg=svg)
+
+    # Energy vs TrafficInterval (en messages par heure)
+    plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                       f'{output_dir}/traffic_scenario_energy_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png',
+                       'Messages per Hour', 'Energy Consumption (mJ)',
+                       f'Energy vs Messages per Hour - Traffic Scenario\n({params})', **axes_opts, svg=svg)
+
+
+def plot_traffic_scenario_mobility33(df_traffic, output_dir='output', svg=False):
     """
     Génère 2 graphiques pour le scénario intervalle_d_envoie: PDR et énergie en fonction de TrafficInterval
     avec MobilitySpeed=33.33, NumDevices=1000 et Sigma=3.96
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in df_traffic.columns:
-            df_traffic[col] = pd.to_numeric(df_traffic[col], errors='coerce')
+    # Colonnes numériques: déjà converties une seule fois par load_data
     
     # Paramètres fixes
     mobility_speed = 0
@@ -1387,100 +1463,23 @@ def plot_traffic_scenario_mobility33(df_traffic, output_dir='output'):
     sigma = 3.96
     
     # Filtrer les données selon les paramètres spécifiés
-    filtered = df_traffic[
-        (df_traffic['MobilitySpeed'] == mobility_speed) &
-        (df_traffic['NumDevices'] == num_devices) &
-        (df_traffic['Sigma'] == sigma)
-    ]
+    filtered = df_traffic.query("MobilitySpeed == @mobility_speed and NumDevices == @num_devices and Sigma == @sigma")
     
     if filtered.empty:
         print(f"⚠ Pas de données pour le scénario intervalle_d_envoie avec MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma}")
         return
-    
-    # Définir les ticks pour TrafficInterval et convertir en messages par heure
-    traffic_ticks = [72, 360, 1800, 3600]
-    messages_per_hour = [int(3600/t) for t in traffic_ticks]
-    
-    # PDR vs TrafficInterval (en messages par heure)
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('TrafficInterval')['PDR_Percent'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='TrafficInterval')
-        # Convertir TrafficInterval en messages par heure
-        grp['MessagesPerHour'] = 3600 / grp['TrafficInterval']
-        plt.plot(grp['MessagesPerHour'], grp['PDR_Percent'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Messages per Hour', fontweight='bold')
-        plt.ylabel('Packet Delivery Rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Messages per Hour - Traffic Scenario (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma})', fontweight='bold')
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.xlim(1, 60)
-        plt.xticks(messages_per_hour, [f'{m} messages per hour' for m in messages_per_hour])
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/traffic_scenario_pdr_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
-    else:
-        plt.close()
-    
-    # Energy vs TrafficInterval
-    plt.figure(figsize=(10, 6))
-    plotted = False
-    for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-        if alg not in filtered['alg'].unique():
-            continue
-        grp = filtered[filtered['alg'] == alg].groupby('TrafficInterval')['AvgEnergy_mJ'].mean().reset_index()
-        if grp.empty:
-            continue
-        grp = grp.sort_values(by='TrafficInterval')
-        # Convertir TrafficInterval en messages par heure
-        grp['MessagesPerHour'] = 3600 / grp['TrafficInterval']
-        plt.plot(grp['MessagesPerHour'], grp['AvgEnergy_mJ'], 
-                marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                label=alg, linewidth=2.5, markersize=8)
-        plotted = True
-    
-    if plotted:
-        plt.xlabel('Messages per Hour', fontweight='bold')
-        plt.ylabel('Energy Consumption (mJ)', fontweight='bold')
-        plt.title(f'Energy vs Messages per Hour - Traffic Scenario (MobilitySpeed={mobility_speed}, NumDevices={num_devices}, Sigma={sigma})', fontweight='bold')
-        plt.xlim(1, 60)
-        plt.xticks(messages_per_hour, [f'{m} messages per hour' for m in messages_per_hour])
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/traffic_scenario_energy_mobility{mobility_speed}_density{num_devices}_sigma{sigma}.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
-    else:
-        plt.close()
+
+    means = mean_by_alg(filtered, 'TrafficInterval')
+    _plot_traffic_scenario(means, mobility_speed, num_devices, sigma, output_dir, svg=svg)
 
 
-def plot_mobility_impact_specific_params(dfs_dict, output_dir='output'):
+def plot_mobility_impact_specific_params(dfs_dict, output_dir='output', svg=False):
     """
     Génère 6 courbes (3 PDR + 3 énergie) en fonction de la mobilité avec des paramètres spécifiques:
     - densité 100, intervalle 3600s, sigma 3.96
     - densité 550, intervalle 3600s, sigma 3.96  
     - densité 1000, intervalle 3600s, sigma 3.96
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
     # Configuration des 3 cas
     configs = [
         {'NumDevices': 100, 'TrafficInterval': 3600, 'Sigma': 3.96, 'label': '100 nodes'},
@@ -1488,328 +1487,355 @@ def plot_mobility_impact_specific_params(dfs_dict, output_dir='output'):
         {'NumDevices': 1000, 'TrafficInterval': 3600, 'Sigma': 3.96, 'label': '1000 nodes'}
     ]
     
-    # Utiliser toutes les données disponibles (combiner tous les scénarios)
-    all_df_list = []
-    for scenario_name, df in dfs_dict.items():
-        all_df_list.append(df)
-    
-    if not all_df_list:
+    # Utiliser toutes les données disponibles (tous les scénarios, concaténés une seule fois)
+    all_df = combine_scenarios(dfs_dict)
+    if all_df is None:
         print("⚠ Aucune donnée disponible pour l'analyse de mobilité")
         return
-        
-    all_df = pd.concat(all_df_list, ignore_index=True)
     
-    # Normaliser les colonnes numériques
-    for col in ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']:
-        if col in all_df.columns:
-            all_df[col] = pd.to_numeric(all_df[col], errors='coerce')
+    # Un seul filtre et un seul groupby pour les 3 cas (intervalle et sigma
+    # communs), PDR et énergie moyennés ensemble; chaque cas est ensuite une
+    # simple sélection dans la table (même format que mean_by_alg)
+    devices = [config['NumDevices'] for config in configs]
+    common = configs[0]
+    filtered = all_df.query("NumDevices in @devices and TrafficInterval == @common['TrafficInterval'] and Sigma == @common['Sigma']")
+    all_means = (filtered.groupby(['NumDevices', 'alg', 'MobilitySpeed'], observed=True, sort=True)
+                 [['PDR_Percent', 'AvgEnergy_mJ']].mean().unstack('alg'))
+    present = set(all_means.index.get_level_values('NumDevices'))
     
     # Génerer les graphiques PDR
     for i, config in enumerate(configs):
-        # Filtrer les données selon la configuration
-        filtered = all_df[
-            (all_df['NumDevices'] == config['NumDevices']) &
-            (all_df['TrafficInterval'] == config['TrafficInterval']) &
-            (all_df['Sigma'] == config['Sigma'])
-        ]
-        
-        if filtered.empty:
+        if config['NumDevices'] not in present:
             print(f"⚠ Pas de données pour la configuration: {config}")
             continue
+
+        means = all_means.xs(config['NumDevices'], level='NumDevices')
+        params = f'{config["label"]} (TrafficInterval=3600s, Sigma=3.96)'
         
         # PDR vs MobilitySpeed
-        plt.figure(figsize=(10, 6))
-        plotted = False
-        for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-            if alg not in filtered['alg'].unique():
-                continue
-            grp = filtered[filtered['alg'] == alg].groupby('MobilitySpeed')['PDR_Percent'].mean().reset_index()
-            if grp.empty:
-                continue
-            grp = grp.sort_values(by='MobilitySpeed')
-            plt.plot(grp['MobilitySpeed'], grp['PDR_Percent'], 
-                    marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                    label=alg, linewidth=2.5, markersize=8)
-            plotted = True
-        
-        if not plotted:
-            plt.close()
+        if not plot_metric_by_alg(means, 'PDR_Percent',
+                                  f'{output_dir}/pdr_mobility_{config["NumDevices"]}nodes_3600s_396sigma.png',
+                                  'Mobilité des nœuds (m/s)', 'packet delivery rate (%)',
+                                  f'PDR vs Mobilité - {params}',
+                                  ylim=(0, 100), yticks=PERCENT_TICKS, svg=svg):
             continue
-            
-        plt.xlabel('Mobilité des nœuds (m/s)', fontweight='bold')
-        plt.ylabel('packet delivery rate (%)', fontweight='bold')
-        plt.title(f'PDR vs Mobilité - {config["label"]} (TrafficInterval=3600s, Sigma=3.96)', fontweight='bold')
-        plt.ylim(0, 100)
-        plt.yticks(np.arange(0, 101, 20))
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_pdr = f'{output_dir}/pdr_mobility_{config["NumDevices"]}nodes_3600s_396sigma.png'
-        plt.tight_layout()
-        plt.savefig(out_pdr, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_pdr}")
         
         # Energy vs MobilitySpeed
-        plt.figure(figsize=(10, 6))
-        plotted = False
-        for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-            if alg not in filtered['alg'].unique():
-                continue
-            grp = filtered[filtered['alg'] == alg].groupby('MobilitySpeed')['AvgEnergy_mJ'].mean().reset_index()
-            if grp.empty:
-                continue
-            grp = grp.sort_values(by='MobilitySpeed')
-            plt.plot(grp['MobilitySpeed'], grp['AvgEnergy_mJ'], 
-                    marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), 
-                    label=alg, linewidth=2.5, markersize=8)
-            plotted = True
-        
-        if not plotted:
-            plt.close()
-            continue
-            
-        plt.xlabel('Mobilité des nœuds (m/s)', fontweight='bold')
-        plt.ylabel('Énergie moyenne (mJ)', fontweight='bold')
-        plt.title(f'Énergie vs Mobilité - {config["label"]} (TrafficInterval=3600s, Sigma=3.96)', fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.legend()
-        
-        out_energy = f'{output_dir}/energy_mobility_{config["NumDevices"]}nodes_3600s_396sigma.png'
-        plt.tight_layout()
-        plt.savefig(out_energy, dpi=300, bbox_inches='tight')
-        plt.close()
-        print(f"✓ Graphique sauvegardé: {out_energy}")
+        plot_metric_by_alg(means, 'AvgEnergy_mJ',
+                           f'{output_dir}/energy_mobility_{config["NumDevices"]}nodes_3600s_396sigma.png',
+                           'Mobilité des nœuds (m/s)', 'Énergie moyenne (mJ)',
+                           f'Énergie vs Mobilité - {params}', svg=svg)
 
 
-def plot_traffic_interval_analysis(df_traffic, output_dir='output'):
+def plot_traffic_interval_analysis(df_traffic, output_dir='output', svg=False):
     """
     Analyse l'impact de l'intervalle de trafic
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = reuse_figure((16, 12))
+    axes = fig.subplots(2, 2)
     fig.suptitle('Impact de l\'intervalle de trafic (Traffic Interval)', 
                  fontsize=16, fontweight='bold')
     
+    # algorithmes présents, dans l'ordre des catégories (calculé au chargement)
+    algs = get_algs(df_traffic)
+    # Efficacité par ligne, puis moyennes des 4 mesures en un seul groupby
+    data = df_traffic.assign(Efficiency=df_traffic['PDR_Percent'] / df_traffic['AvgEnergy_mJ'])
+    means = mean_by_alg(data, 'TrafficInterval',
+                        columns=('PDR_Percent', 'AvgEnergy_mJ', 'SuccessfulPackets', 'Efficiency'))
+    
     # 1. packet delivery rate en fonction de l'intervalle
     ax1 = axes[0, 0]
-    for alg in df_traffic['alg'].unique():
-        alg_data = df_traffic[df_traffic['alg'] == alg].groupby('TrafficInterval')['PDR_Percent'].mean().reset_index()
-        ax1.plot(alg_data['TrafficInterval'], alg_data['PDR_Percent'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2.5, markersize=10)
+    ax1_handles = plot_alg_lines(ax1, curves_by_alg(means['PDR_Percent'], algs), linewidth=2.5, markersize=10)
     
     ax1.set_xlabel('Intervalle de trafic (s)', fontweight='bold')
     ax1.set_ylabel('packet delivery rate (%)', fontweight='bold')
     ax1.set_title('packet delivery rate vs Intervalle de trafic', fontweight='bold')
     # limit and ticks for traffic interval requested by user
     ax1.set_xlim(72, 3600)
-    ax1.set_xticks([72, 300, 600, 900, 1200, 1800, 2400, 3600])
+    ax1.set_xticks(TRAFFIC_SECONDS)
     ax1.set_ylim(0, 100)
-    ax1.set_yticks(np.arange(0, 101, 20))
+    ax1.set_yticks(PERCENT_TICKS)
     ax1.set_xscale('log')
-    ax1.legend(loc='best')
+    ax1.legend(handles=ax1_handles, loc='best')
     ax1.grid(True, alpha=0.3, which='both')
     
     # 2. Énergie en fonction de l'intervalle
     ax2 = axes[0, 1]
-    for alg in df_traffic['alg'].unique():
-        alg_data = df_traffic[df_traffic['alg'] == alg].groupby('TrafficInterval')['AvgEnergy_mJ'].mean().reset_index()
-        ax2.plot(alg_data['TrafficInterval'], alg_data['AvgEnergy_mJ'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2.5, markersize=10)
+    ax2_handles = plot_alg_lines(ax2, curves_by_alg(means['AvgEnergy_mJ'], algs), linewidth=2.5, markersize=10)
     
     ax2.set_xlabel('Intervalle de trafic (s)', fontweight='bold')
     ax2.set_ylabel('Énergie moyenne (mJ)', fontweight='bold')
     ax2.set_title('Énergie vs Intervalle de trafic', fontweight='bold')
     ax2.set_xscale('log')
-    ax2.legend(loc='best')
+    ax2.legend(handles=ax2_handles, loc='best')
     ax2.grid(True, alpha=0.3, which='both')
     
     # 3. Nombre de paquets réussis
     ax3 = axes[1, 0]
-    for alg in df_traffic['alg'].unique():
-        alg_data = df_traffic[df_traffic['alg'] == alg].groupby('TrafficInterval')['SuccessfulPackets'].mean().reset_index()
-        ax3.plot(alg_data['TrafficInterval'], alg_data['SuccessfulPackets'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2.5, markersize=10)
+    ax3_handles = plot_alg_lines(ax3, curves_by_alg(means['SuccessfulPackets'], algs), linewidth=2.5, markersize=10)
     
     ax3.set_xlabel('Intervalle de trafic (s)', fontweight='bold')
     ax3.set_ylabel('Paquets réussis', fontweight='bold')
     ax3.set_title('Paquets réussis vs Intervalle de trafic', fontweight='bold')
     ax3.set_xscale('log')
-    ax3.legend(loc='best')
+    ax3.legend(handles=ax3_handles, loc='best')
     ax3.grid(True, alpha=0.3, which='both')
     
     # 4. Efficacité
     ax4 = axes[1, 1]
-    for alg in df_traffic['alg'].unique():
-        alg_data = df_traffic[df_traffic['alg'] == alg].copy()
-        alg_data['Efficiency'] = alg_data['PDR_Percent'] / alg_data['AvgEnergy_mJ']
-        efficiency_grouped = alg_data.groupby('TrafficInterval')['Efficiency'].mean().reset_index()
-        ax4.plot(efficiency_grouped['TrafficInterval'], efficiency_grouped['Efficiency'], 
-                marker=MARKERS[alg], color=COLORS[alg], 
-                label=alg, linewidth=2.5, markersize=10)
+    ax4_handles = plot_alg_lines(ax4, curves_by_alg(means['Efficiency'], algs), linewidth=2.5, markersize=10)
     
     ax4.set_xlabel('Intervalle de trafic (s)', fontweight='bold')
     ax4.set_ylabel('Efficacité (packet delivery rate/mJ)', fontweight='bold')
     ax4.set_title('Efficacité vs Intervalle de trafic', fontweight='bold')
     ax4.set_xscale('log')
-    ax4.legend(loc='best')
+    ax4.legend(handles=ax4_handles, loc='best')
     ax4.grid(True, alpha=0.3, which='both')
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/analyse_traffic_interval.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    save_figure(fig, f'{output_dir}/analyse_traffic_interval.png', svg=svg)
     print(f"✓ Graphique sauvegardé: analyse_traffic_interval.png")
 
 
-def plot_histograms_per_scenario(dfs_dict, metrics=None, output_dir='output'):
+def plot_histograms_per_scenario(dfs_dict, metrics=None, output_dir='output', svg=False):
     """Pour chaque scénario, crée un histogramme par metric contenant les 4 algorithmes sur la même image."""
-    Path(output_dir).mkdir(exist_ok=True)
     if metrics is None:
         metrics = ['PDR_Percent', 'AvgEnergy_mJ']
 
     for scenario_name, df in dfs_dict.items():
+        # Positions des lignes de chaque algorithme présent, calculées une fois
+        # par scénario: test de présence et sélection par simple accès au dict
+        rows = df.groupby('alg', observed=True).indices
         for metric in metrics:
             if metric not in df.columns:
                 continue
-            plt.figure(figsize=(10, 6))
-            for alg in ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']:
-                if alg not in df['alg'].unique():
+            values = pd.to_numeric(df[metric], errors='coerce').to_numpy()
+            fig, ax = reuse_axes((10, 6))
+            series, labels, codes = [], [], []
+            for code, alg in enumerate(ALGORITHMS):
+                if alg not in rows:
                     continue
-                data = pd.to_numeric(df[df['alg'] == alg][metric], errors='coerce').dropna()
-                if data.empty:
+                data = values[rows[alg]]
+                data = data[~np.isnan(data)]
+                if data.size == 0:
                     continue
-                plt.hist(data, bins=20, alpha=0.5, label=alg, color=COLORS.get(alg))
-            plt.xlabel(metric)
+                series.append(data)
+                labels.append(alg)
+                codes.append(code)
+            # Un seul appel hist pour tous les algorithmes: bornes des 20
+            # classes communes, calculées une fois sur l'ensemble des séries
+            # (légende construite depuis les patches: hist les liste à l'envers)
+            handles = None
+            if series:
+                _, _, patches = ax.hist(series, bins=20, alpha=0.5, label=labels, color=COLOR_ARR[codes],
+                                        histtype='stepfilled')
+                handles = [p[0] for p in patches]
             # Replace metric label for PDR
             if metric == 'PDR_Percent':
-                plt.xlabel('packet delivery rate (%)')
-                plt.xlim(0, 100)
-                plt.xticks(np.arange(0, 101, 20))
+                ax.set_xlabel('packet delivery rate (%)')
+                ax.set_xlim(0, 100)
+                ax.set_xticks(PERCENT_TICKS)
             else:
-                plt.xlabel(metric)
-            plt.ylabel('Count')
-            plt.title(f'Histogramme {metric} - Scénario: {scenario_name}')
-            plt.legend()
-            plt.grid(alpha=0.3)
+                ax.set_xlabel(metric)
+            ax.set_ylabel('Count')
+            ax.set_title(f'Histogramme {metric} - Scénario: {scenario_name}')
+            ax.legend(handles=handles)
+            ax.grid(alpha=0.3)
             out = f'{output_dir}/hist_{scenario_name}_{metric}.png'
-            plt.tight_layout()
-            plt.savefig(out, dpi=200)
-            plt.close()
+            save_figure(fig, out, svg=svg)
             print(f"✓ Histogramme sauvegardé: {out}")
 
 
-def plot_per_scenario_metric_vs_x(dfs_dict, x_params=None, metrics=None, output_dir='output'):
+def plot_per_scenario_metric_vs_x(dfs_dict, x_params=None, metrics=None, output_dir='output', svg=False):
     """Pour chaque scénario, trace des courbes metric vs x où chaque image contient les 4 algorithmes.
 
     Sauvegarde un fichier par (scenario, metric, x).
     """
-    Path(output_dir).mkdir(exist_ok=True)
     if x_params is None:
         x_params = ['NumDevices', 'TrafficInterval', 'Sigma', 'MobilitySpeed']
     if metrics is None:
         metrics = ['PDR_Percent', 'AvgEnergy_mJ']
 
-    alg_order = ['ADR-AVG', 'ADR-Lite', 'ADR-MAX', 'No-ADR']
-
     for scenario_name, df in dfs_dict.items():
-        for metric in metrics:
+        # Moyennes par (alg, x) de toutes les mesures, un seul groupby par x
+        # et par scénario, réutilisé pour chaque mesure
+        present = [m for m in metrics if m in df.columns]
+        means_by_x = {x: mean_by_alg(df, x, columns=present)
+                      for x in x_params if x in df.columns and present}
+        # Valeurs de NumDevices présentes (annotation de chaque figure),
+        # calculées une fois par scénario et non pour chaque (metric, x)
+        nd_str = format_num_devices(df['NumDevices']) if 'NumDevices' in df.columns else None
+        for metric in present:
             for x in x_params:
-                if x not in df.columns or metric not in df.columns:
+                if x not in means_by_x:
                     continue
-                plt.figure(figsize=(10, 6))
-                plotted = False
-                for alg in alg_order:
-                    if alg not in df['alg'].unique():
-                        continue
-                    sub = df[df['alg'] == alg]
-                    x_vals = pd.to_numeric(sub[x], errors='coerce')
-                    y_vals = pd.to_numeric(sub[metric], errors='coerce')
-                    temp = pd.concat([x_vals, y_vals], axis=1).dropna()
-                    if temp.empty:
-                        continue
-                    grp = temp.groupby(x)[metric].mean().reset_index()
-                    if grp.empty:
-                        continue
-                    grp = grp.sort_values(by=grp.columns[0])
-                    plt.plot(grp.iloc[:,0], grp.iloc[:,1], marker=MARKERS.get(alg, 'o'), color=COLORS.get(alg), label=alg, linewidth=2)
-                    plotted = True
-                if not plotted:
-                    plt.close()
+                # seuls les algorithmes présents donnent une courbe, les
+                # x/mesures manquants sont ignorés
+                curves = curves_by_alg(means_by_x[x][metric])
+                if not curves:
                     continue
+                out = f"{output_dir}/{scenario_name}_{metric}_vs_{x}.png"
+                digest = figure_digest(curves, scenario_name, metric, x, nd_str, svg=svg)
+                if figure_is_current(out, digest, svg=svg):
+                    print(f"✓ Graphique inchangé: {out}")
+                    continue
+                fig, ax = reuse_axes((10, 6))
+                handles = plot_alg_lines(ax, curves, linewidth=2)
                 # axis labels and ticks adjustments requested by user
-                plt.xlabel(x)
+                ax.set_xlabel(x)
                 if metric == 'PDR_Percent':
-                    plt.ylabel('packet delivery rate (%)')
-                    plt.ylim(0, 100)
-                    plt.yticks(np.arange(0, 101, 20))
+                    ax.set_ylabel('packet delivery rate (%)')
+                    ax.set_ylim(0, 100)
+                    ax.set_yticks(PERCENT_TICKS)
                 else:
-                    plt.ylabel(metric)
+                    ax.set_ylabel(metric)
 
                 # x-axis adjustments
                 if x == 'NumDevices':
-                    plt.xlim(100, 1000)
-                    plt.xticks(np.arange(100, 1001, 100))
+                    ax.set_xlim(100, 1000)
+                    ax.set_xticks(NUM_DEVICES_TICKS)
                 if x == 'TrafficInterval':
-                    plt.xlim(72, 3600)
-                    plt.xticks([72, 300, 600, 900, 1200, 1800, 2400, 3600])
+                    ax.set_xlim(72, 3600)
+                    ax.set_xticks(TRAFFIC_SECONDS)
 
-                plt.title(f'{metric} vs {x} - Scénario: {scenario_name}')
-                plt.grid(alpha=0.3)
-                plt.legend()
+                ax.set_title(f'{metric} vs {x} - Scénario: {scenario_name}')
+                ax.grid(alpha=0.3)
+                ax.legend(handles=handles)
                 # Préciser le nombre de noeuds présents dans les données (NumDevices)
-                if 'NumDevices' in df.columns:
-                    try:
-                        nd_vals = sorted(pd.to_numeric(df['NumDevices'], errors='coerce').dropna().unique())
-                        if len(nd_vals) > 0:
-                            # format values as integers when appropriate
-                            nd_str = ','.join(str(int(v)) if float(v).is_integer() else str(v) for v in nd_vals)
-                            plt.gca().text(0.99, 0.02, f'NumDevices: {nd_str}', transform=plt.gca().transAxes,
-                                           ha='right', va='bottom', fontsize=9,
-                                           bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
-                    except Exception:
-                        pass
+                if nd_str is not None:
+                    ax.text(0.99, 0.02, f'NumDevices: {nd_str}', transform=ax.transAxes,
+                            ha='right', va='bottom', fontsize=9,
+                            bbox=dict(facecolor='white', alpha=0.7, edgecolor='gray'))
 
-                out = f"{output_dir}/{scenario_name}_{metric}_vs_{x}.png"
-                plt.tight_layout()
-                plt.savefig(out, dpi=200)
-                plt.close()
+                save_figure(fig, out, digest=digest, svg=svg)
                 print(f"✓ Graphique sauvegardé: {out}")
 
 
+# Taille à partir de laquelle le noyau numba compense son temps de compilation
+NUMBA_MIN_ROWS = 100_000
+
+
+def _group_mean_std_kernel(values, group_ids, ngroups):
+    """Moyenne et écart-type (ddof=1) par groupe, valeurs NaN ignorées
+    (compilé par numba)."""
+    sums = np.zeros(ngroups)
+    counts = np.zeros(ngroups, np.int64)
+    for i in range(len(values)):
+        if not np.isnan(values[i]):
+            sums[group_ids[i]] += values[i]
+            counts[group_ids[i]] += 1
+    means = np.full(ngroups, np.nan)
+    for g in range(ngroups):
+        if counts[g] > 0:
+            means[g] = sums[g] / counts[g]
+    # deuxième passe sur les écarts à la moyenne (pas de sumsq - mean²,
+    # qui perd en précision)
+    squares = np.zeros(ngroups)
+    for i in range(len(values)):
+        if not np.isnan(values[i]):
+            d = values[i] - means[group_ids[i]]
+            squares[group_ids[i]] += d * d
+    stds = np.full(ngroups, np.nan)
+    for g in range(ngroups):
+        if counts[g] > 1:
+            stds[g] = np.sqrt(squares[g] / (counts[g] - 1))
+    return means, stds
+
+if njit is not None:
+    _group_mean_std_kernel = njit(cache=True)(_group_mean_std_kernel)
+
+
+def _summary_stats_numba(big):
+    """Statistiques du tableau récapitulatif calculées par le noyau numba.
+
+    Même résultat que le groupby (scénario, alg) de generate_summary_table:
+    groupes dans l'ordre d'apparition, algorithmes inconnus ignorés.
+    """
+    alg_codes = big['alg'].cat.codes.to_numpy()
+    known = alg_codes >= 0
+    scen_codes, scenarios = pd.factorize(big.index.get_level_values('Scénario'))
+    categories = big['alg'].cat.categories
+    pair_codes = scen_codes[known] * len(categories) + alg_codes[known]
+    group_ids, pairs = pd.factorize(pair_codes)
+    index = pd.MultiIndex.from_arrays(
+        [scenarios[pairs // len(categories)],
+         pd.Categorical.from_codes(pairs % len(categories), dtype=big['alg'].dtype)],
+        names=['Scénario', 'alg'])
+
+    def mean_std(column):
+        values = big[column].to_numpy(dtype=np.float64)[known]
+        return _group_mean_std_kernel(values, group_ids, len(pairs))
+
+    stats = {}
+    stats['pdr_mean'], stats['pdr_std'] = mean_std('PDR_Percent')
+    stats['energy_mean'], stats['energy_std'] = mean_std('AvgEnergy_mJ')
+    stats['efficiency'] = mean_std('Efficiency')[0]
+    return pd.DataFrame(stats, index=index)
+
+
 def generate_summary_table(dfs_dict, output_dir='output'):
     """
     Génère un tableau récapitulatif des performances moyennes
     """
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    summary_data = []
-    
-    for scenario_name, df in dfs_dict.items():
-        for alg in df['alg'].unique():
-            alg_data = df[df['alg'] == alg]
-            summary_data.append({
-                'Scénario': scenario_name,
-                'Algorithme': alg,
-                'packet delivery rate moyen (%)': f"{alg_data['PDR_Percent'].mean():.2f}",
-                'packet delivery rate std': f"{alg_data['PDR_Percent'].std():.2f}",
-                'Énergie moyenne (mJ)': f"{alg_data['AvgEnergy_mJ'].mean():.2f}",
-                'Énergie std': f"{alg_data['AvgEnergy_mJ'].std():.2f}",
-                'Efficacité': f"{(alg_data['PDR_Percent'] / alg_data['AvgEnergy_mJ']).mean():.2f}"
-            })
-    
-    summary_df = pd.DataFrame(summary_data)
+    # Tous les scénarios dans un seul DataFrame (niveau d'index 'Scénario'),
+    # puis toutes les statistiques en un seul groupby (scénario, alg).
+    # sort=False garde l'ordre d'apparition des algorithmes dans chaque scénario.
+    cols = ['alg', 'PDR_Percent', 'AvgEnergy_mJ']
+    big = pd.concat({name: df[cols] for name, df in dfs_dict.items()}, names=['Scénario'])
+    big['alg'] = to_alg_category(big['alg'])
+    big['Efficiency'] = big['PDR_Percent'] / big['AvgEnergy_mJ']
+    if njit is not None and len(big) >= NUMBA_MIN_ROWS:
+        stats = _summary_stats_numba(big)
+    else:
+        stats = big.groupby([big.index.get_level_values('Scénario'), 'alg'], observed=True, sort=False).agg(
+            pdr_mean=('PDR_Percent', 'mean'), pdr_std=('PDR_Percent', 'std'),
+            energy_mean=('AvgEnergy_mJ', 'mean'), energy_std=('AvgEnergy_mJ', 'std'),
+            efficiency=('Efficiency', 'mean'))
+    
+    # Series.map colonne par colonne (DataFrame.map n'existe qu'à partir de pandas 2.1)
+    summary_df = stats.apply(lambda col: col.map('{:.2f}'.format)).reset_index()
+    summary_df.columns = ['Scénario', 'Algorithme',
+                          'packet delivery rate moyen (%)', 'packet delivery rate std',
+                          'Énergie moyenne (mJ)', 'Énergie std', 'Efficacité']
     summary_df.to_csv(f'{output_dir}/resume_performances.csv', index=False)
     print(f"✓ Tableau récapitulatif sauvegardé: resume_performances.csv")
     
     return summary_df
 
 
+def run_plot_tasks(tasks, max_workers=None):
+    """Exécute les tâches de tracé `(fonction, args)` dans un ProcessPoolExecutor.
+
+    Chaque fonction écrit ses propres fichiers et ne renvoie rien d'utile, les
+    tâches sont donc indépendantes. Les exceptions des workers sont relevées
+    dans le processus principal. Par défaut, un worker par cœur réellement
+    disponible pour ce processus (affinité CPU), sans dépasser le nombre de
+    tâches; avec un seul worker (`max_workers=1` ou machine mono-cœur) les
+    tâches s'exécutent séquentiellement, sans coût de fork ni de sérialisation.
+    """
+    if max_workers is None:
+        try:
+            cores = len(os.sched_getaffinity(0))
+        except AttributeError:  # pas d'affinité CPU hors Linux
+            cores = os.cpu_count() or 1
+        max_workers = min(cores, len(tasks))
+    if max_workers <= 1:
+        for func, args in tasks:
+            func(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, *args) for func, args in tasks]
+        for future in as_completed(futures):
+            future.result()
+
+
 def main():
     """Fonction principale"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--svg', action='store_true',
+                        help='écrire aussi une version .svg des graphiques')
+    args = parser.parse_args()
+
     print("="*70)
     print(" ANALYSE DES PERFORMANCES DES ALGORITHMES ADR - LoRaWAN".center(70))
     print("="*70)
@@ -1823,6 +1849,13 @@ def main():
         'sigma': 'summary_sigma_run1.csv'
     }
     
+    # Créer le dossier de sortie une seule fois: les fonctions de tracé
+    # supposent qu'il existe
+    output_dir = 'output'
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    # Scénarios déjà concaténés lors d'une exécution précédente
+    cache_dir = Path(output_dir) / '_cache'
+    
     # Charger les données (auto-discover des CSVs par scénario)
     print("📁 Chargement des données...")
     dfs = {}
@@ -1833,6 +1866,15 @@ def main():
             print(f"   ✗ Aucun fichier trouvé pour le scénario '{scenario}' (checked cwd, resultsfinal/summaries/{scenario}/, resultsfinal2/summaries/{scenario}/)")
             continue
 
+        # Sources inchangées depuis la dernière exécution: relire le scénario
+        # concaténé sans recharger ni reconcaténer les CSV
+        cache_path = scenario_cache_path(scenario, found_paths, cache_dir)
+        cached = read_scenario_cache(cache_path)
+        if cached is not None:
+            dfs[scenario] = cached
+            print(f"   ✓ Scénario '{scenario}' relu depuis le cache ({len(found_paths)} fichiers, {len(cached)} lignes)")
+            continue
+
         # load and concatenate all found CSVs for the scenario
         df_list = []
         loaded_paths = []
@@ -1840,7 +1882,7 @@ def main():
         total_rows = 0
         for path in found_paths:
             try:
-                df_part = load_data(path)
+                df_part = load_data_cached(str(Path(path).resolve()))
                 df_list.append(df_part)
                 loaded_paths.append(path)
                 total_rows += len(df_part)
@@ -1852,6 +1894,12 @@ def main():
             except Exception:
                 # fallback: if concatenation fails, take first
                 dfs[scenario] = df_list[0]
+            # les catégories/attrs peuvent différer entre fichiers: recalculer
+            dfs[scenario]['alg'] = to_alg_category(dfs[scenario]['alg'])
+            cache_attrs(dfs[scenario])
+            # cache réutilisable seulement si tous les fichiers ont été lus
+            if not failed_paths:
+                write_scenario_cache(dfs[scenario], cache_path)
             print(f"   ✓ {len(loaded_paths)} fichiers chargés pour le scénario '{scenario}' ({total_rows} lignes au total)")
             if failed_paths:
                 print(f"   ⚠ {len(failed_paths)} fichiers n'ont pas pu être chargés (voir logs).")
@@ -1862,77 +1910,68 @@ def main():
     
     print(f"\n✓ {len(dfs)} fichiers chargés avec succès\n")
     
-    # Créer le dossier de sortie
-    output_dir = 'output'
-    Path(output_dir).mkdir(exist_ok=True)
-    
+    # Concaténation de tous les scénarios, partagée par les analyses à
+    # paramètres fixes (au lieu d'un pd.concat par fonction)
+    all_df = combine_scenarios(dfs)
+
+    # Les fonctions de tracé sont indépendantes: on les collecte puis on les
+    # exécute en parallèle (une tâche par fonction)
+    # `svg` est passé à chaque tâche: aucun état global à propager aux workers
+    svg = args.svg
+    tasks = []
+
     # Générer les graphiques pour chaque scénario
-    print("📊 Génération des graphiques par scénario...")
     for scenario_name, df in dfs.items():
-        print(f"\n   → Scénario: {scenario_name.upper()}")
-        plot_pdr_energy_by_scenario(df, scenario_name, output_dir)
-        plot_energy_efficiency(df, scenario_name, output_dir)
-        plot_heatmap_pdr(df, scenario_name, output_dir)
-
-    # Graphiques individuels par scénario (metric vs paramètre) et histogrammes
-    print("\n📊 Génération des graphiques individuels par scénario (métriques vs paramètres)...")
-    plot_per_scenario_metric_vs_x(dfs, x_params=['NumDevices','TrafficInterval','Sigma','MobilitySpeed'],
-                                 metrics=['PDR_Percent','AvgEnergy_mJ'], output_dir=output_dir)
-    print("\n📊 Génération des histogrammes par scénario (packet delivery rate et énergie)...")
-    plot_histograms_per_scenario(dfs, metrics=['PDR_Percent','AvgEnergy_mJ'], output_dir=output_dir)
+        tasks.append((plot_pdr_energy_by_scenario, (df, scenario_name, output_dir, svg)))
+        tasks.append((plot_energy_efficiency, (df, scenario_name, output_dir, svg)))
+        tasks.append((plot_heatmap_pdr, (df, scenario_name, output_dir, svg)))
+        # Graphiques individuels (metric vs paramètre) et histogrammes: une
+        # tâche par scénario pour répartir ces nombreuses figures entre les
+        # workers (chaque tâche ne reçoit que le DataFrame de son scénario)
+        tasks.append((plot_per_scenario_metric_vs_x, ({scenario_name: df},
+                                                      ['NumDevices','TrafficInterval','Sigma','MobilitySpeed'],
+                                                      ['PDR_Percent','AvgEnergy_mJ'], output_dir, svg)))
+        tasks.append((plot_histograms_per_scenario, ({scenario_name: df}, ['PDR_Percent','AvgEnergy_mJ'],
+                                                     output_dir, svg)))
     
     # Graphiques comparatifs
-    print("\n📊 Génération des graphiques comparatifs...")
-    plot_parameter_comparison(dfs, output_dir)
+    tasks.append((plot_parameter_comparison, (dfs, output_dir, svg)))
     
     # Analyses spécifiques
     if 'sigma' in dfs:
-        print("\n📊 Analyse de l'impact de Sigma...")
-        plot_sigma_impact(dfs['sigma'], output_dir)
+        tasks.append((plot_sigma_impact, (dfs['sigma'], output_dir, svg)))
         # additionally produce sigma-impact plot filtered to MobilitySpeed == 0
-        plot_sigma_impact_mobility0(dfs['sigma'], output_dir)
+        tasks.append((plot_sigma_impact_mobility0, (dfs['sigma'], output_dir, svg)))
     
     if 'intervalle_d_envoie' in dfs:
-        print("\n📊 Analyse de l'impact de l'intervalle de trafic...")
-        plot_traffic_interval_analysis(dfs['intervalle_d_envoie'], output_dir)
+        tasks.append((plot_traffic_interval_analysis, (dfs['intervalle_d_envoie'], output_dir, svg)))
         # additionally produce traffic-impact plots filtered to MobilitySpeed == 0
-        plot_traffic_impact_mobility0(dfs['intervalle_d_envoie'], output_dir)
+        tasks.append((plot_traffic_impact_mobility0, (dfs['intervalle_d_envoie'], output_dir, svg)))
 
     if 'density' in dfs:
         # produce density-impact plot filtered to MobilitySpeed == 0
-        plot_density_impact_mobility0(dfs['density'], output_dir)
+        tasks.append((plot_density_impact_mobility0, (dfs['density'], output_dir, svg)))
 
     # Analyse spécifique: densité en fonction de paramètres fixes (MobilitySpeed=0, TrafficInterval=3600s, Sigma=3.96)
-    print("\n📊 Génération des graphiques densité avec paramètres fixes...")
-    plot_density_impact_fixed_params(dfs, output_dir)
+    tasks.append((plot_density_impact_fixed_params, (all_df, output_dir, svg)))
     
     # Analyse spécifique: intervalle de trafic en fonction de paramètres fixes (MobilitySpeed=0, NumDevices=550, Sigma=3.96)
-    print("\n📊 Génération des graphiques intervalle de trafic avec paramètres fixes...")
-    plot_traffic_impact_fixed_params(dfs, output_dir)
+    tasks.append((plot_traffic_impact_fixed_params, (all_df, output_dir, svg)))
     
-    # Analyse spécifique: densité pour le scénario density uniquement (MobilitySpeed=0, TrafficInterval=3600, Sigma=3.96)
+    # Analyses spécifiques par scénario (density, sigma, intervalle_d_envoie)
     if 'density' in dfs:
-        print("\n📊 Génération des graphiques densité spécifiques pour le scénario density...")
-        plot_density_scenario_specific(dfs['density'], output_dir)
-    
-    # Analyse spécifique: sigma pour le scénario sigma uniquement (MobilitySpeed=0, NumDevices=550, TrafficInterval=3600)
+        tasks.append((plot_density_scenario_specific, (dfs['density'], output_dir, svg)))
     if 'sigma' in dfs:
-        print("\n📊 Génération des graphiques sigma spécifiques pour le scénario sigma...")
-        plot_sigma_scenario_specific(dfs['sigma'], output_dir)
-    
-    # Analyse spécifique: traffic pour le scénario intervalle_d_envoie uniquement (MobilitySpeed=0, NumDevices=550/1000, Sigma=3.96)
-    if 'intervalle_d_envoie' in dfs:
-        print("\n📊 Génération des graphiques traffic spécifiques pour le scénario intervalle_d_envoie...")
-        plot_traffic_scenario_specific(dfs['intervalle_d_envoie'], output_dir)
-    
-    # Analyse spécifique: traffic avec mobilité 33.33 pour le scénario intervalle_d_envoie uniquement (MobilitySpeed=33.33, NumDevices=1000, Sigma=3.96)
+        tasks.append((plot_sigma_scenario_specific, (dfs['sigma'], output_dir, svg)))
     if 'intervalle_d_envoie' in dfs:
-        print("\n📊 Génération des graphiques traffic avec mobilité 33.33 pour le scénario intervalle_d_envoie...")
-        plot_traffic_scenario_mobility33(dfs['intervalle_d_envoie'], output_dir)
+        tasks.append((plot_traffic_scenario_specific, (dfs['intervalle_d_envoie'], output_dir, svg)))
+        tasks.append((plot_traffic_scenario_mobility33, (dfs['intervalle_d_envoie'], output_dir, svg)))
     
     # Graphiques spécifiques: mobilité vs PDR/énergie avec paramètres fixes
-    print("\n📊 Génération des graphiques mobilité avec paramètres spécifiques...")
-    plot_mobility_impact_specific_params(dfs, output_dir)
+    tasks.append((plot_mobility_impact_specific_params, (all_df, output_dir, svg)))
+
+    print(f"📊 Génération des graphiques ({len(tasks)} tâches en parallèle)...")
+    run_plot_tasks(tasks)
     
     # Tableau récapitulatif
     print("\n📋 Génération du tableau récapitulatif...")